@@ -29,17 +29,76 @@ except ImportError as e:
     print("Running in basic mode...")
 
     # Import original functionality as fallback
+    import glob
     import os
+    import queue
+    import re
+    import shutil
     import subprocess
     import threading
     import time
     import tkinter as tk
+    from concurrent.futures import ThreadPoolExecutor
     from tkinter import messagebox, ttk
+    from types import MappingProxyType
 
     import cv2
     import mss
     import numpy as np
 
+    # DXGI Desktop Duplication is much faster than MSS's BitBlt on Windows
+    dxcam = None
+    if sys.platform == "win32":
+        try:
+            import dxcam
+        except ImportError:
+            pass
+
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        fcntl = None
+
+    try:
+        from numba import njit, prange
+    except ImportError:
+        njit = None
+
+    if njit is not None:
+
+        @njit(parallel=True, fastmath=True, cache=True)
+        def bgra_to_yuv420p(src, y, u, v):
+            """Convert a BGRA frame to BT.601 limited-range YUV420P planes."""
+            height, width = y.shape
+            for j in prange(height):
+                for i in range(width):
+                    b, g, r = int(src[j, i, 0]), int(src[j, i, 1]), int(src[j, i, 2])
+                    y[j, i] = ((66 * r + 129 * g + 25 * b + 128) >> 8) + 16
+            for j in prange(height // 2):
+                for i in range(width // 2):
+                    b = g = r = 0
+                    for dj in range(2):
+                        for di in range(2):
+                            px = src[2 * j + dj, 2 * i + di]
+                            b += int(px[0])
+                            g += int(px[1])
+                            r += int(px[2])
+                    b, g, r = b >> 2, g >> 2, r >> 2
+                    u[j, i] = ((-38 * r - 74 * g + 112 * b + 128) >> 8) + 128
+                    v[j, i] = ((112 * r - 94 * g - 18 * b + 128) >> 8) + 128
+
+    else:
+        bgra_to_yuv420p = None
+
+    # Resolve pactl once rather than walking PATH on every call
+    PACTL = shutil.which("pactl") or "pactl"
+    # Sink input id and its application.name, without crossing into the
+    # next "Sink Input #" block
+    SINK_INPUT_APP_RE = re.compile(
+        r'Sink Input #(\d+)(?:(?!Sink Input #).)*?application\.name = "([^"]+)"',
+        re.S,
+    )
+
     # Include original classes for fallback
     class SystemAudioCapture:
         def __init__(self, selected_apps: list[str], log_callback=None):
@@ -50,76 +109,74 @@ except ImportError as e:
             self.log = log_callback if log_callback else print
 
         def get_real_sink(self) -> str:
-            sinks = (
-                subprocess.check_output(["pactl", "list", "short", "sinks"])
-                .decode()
-                .splitlines()
-            )
-            for line in sinks:
+            sinks = subprocess.run(
+                [PACTL, "list", "short", "sinks"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            for line in sinks.splitlines():
                 if "record_sink" not in line:
-                    return line.split("\t")[1]
+                    # Only the name (second field) is needed
+                    return line.split("\t", 2)[1]
             raise RuntimeError("No real audio sink found.")
 
         def move_apps_to_record_sink(self) -> None:
-            inputs = subprocess.check_output(["pactl", "list", "sink-inputs"]).decode()
-            for block in inputs.split("Sink Input #"):
-                for app in self.apps_to_capture:
-                    if f'application.name = "{app}"' in block:
-                        lines = block.strip().splitlines()
-                        sink_input_id = None
-                        for line in lines:
-                            if line.strip().startswith("Sink Input"):
-                                sink_input_id = line.strip().split("#")[-1]
-                                break
-                        if not sink_input_id:
-                            sink_input_id = lines[0].strip()
-                        subprocess.run(
-                            ["pactl", "move-sink-input", sink_input_id, "record_sink"]
-                        )
-                        self.log(
-                            f"[AUDIO] Moved {app} (Sink Input #{sink_input_id}) to record_sink"
-                        )
-                        break
+            apps = set(self.apps_to_capture)
+            inputs = subprocess.check_output([PACTL, "list", "sink-inputs"]).decode()
+            # A single regex scan over the dump, then a set lookup per match
+            to_move = {
+                sink_input_id: name
+                for sink_input_id, name in SINK_INPUT_APP_RE.findall(inputs)
+                if name in apps
+            }
 
-        def setup(self) -> None:
-            self.original_default_sink = (
-                subprocess.check_output(["pactl", "get-default-sink"]).decode().strip()
-            )
+            # Launch every move at once and then reap them, rather than
+            # paying for each pactl round-trip in turn
+            procs = {
+                sink_input_id: subprocess.Popen(
+                    [PACTL, "move-sink-input", sink_input_id, "record_sink"]
+                )
+                for sink_input_id in to_move
+            }
+            for sink_input_id, proc in procs.items():
+                proc.wait()
+                self.log(
+                    f"[AUDIO] Moved {to_move[sink_input_id]} (Sink Input #{sink_input_id}) to record_sink"
+                )
+
+        def _pactl(self, *args: str) -> str:
+            return subprocess.run(
+                [PACTL, *args], stdout=subprocess.PIPE, text=True, check=True
+            ).stdout.strip()
 
-            self.null_sink_module = (
-                subprocess.check_output(
-                    [
-                        "pactl",
-                        "load-module",
-                        "module-null-sink",
-                        "sink_name=record_sink",
-                        "rate=48000",
-                        "channels=2",
-                        "sink_properties=device.description=RecordSink",
-                    ]
+        def setup(self) -> None:
+            # These two don't depend on each other, so overlap the round-trips
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                default_sink = pool.submit(self._pactl, "get-default-sink")
+                null_sink = pool.submit(
+                    self._pactl,
+                    "load-module",
+                    "module-null-sink",
+                    "sink_name=record_sink",
+                    "rate=48000",
+                    "channels=2",
+                    "sink_properties=device.description=RecordSink",
                 )
-                .decode()
-                .strip()
-            )
+                self.original_default_sink = default_sink.result()
+                self.null_sink_module = null_sink.result()
 
             real_sink = self.get_real_sink()
 
-            self.loopback_module = (
-                subprocess.check_output(
-                    [
-                        "pactl",
-                        "load-module",
-                        "module-loopback",
-                        "source=record_sink.monitor",
-                        f"sink={real_sink}",
-                        "latency_msec=50",
-                    ]
-                )
-                .decode()
-                .strip()
+            self.loopback_module = self._pactl(
+                "load-module",
+                "module-loopback",
+                "source=record_sink.monitor",
+                f"sink={real_sink}",
+                "latency_msec=50",
             )
 
-            subprocess.run(["pactl", "set-default-sink", "record_sink"])
+            subprocess.run([PACTL, "set-default-sink", "record_sink"])
             self.move_apps_to_record_sink()
 
         def start_recording(self, output_file: str) -> subprocess.Popen:
@@ -131,8 +188,11 @@ except ImportError as e:
                     "pulse",
                     "-i",
                     "record_sink.monitor",
+                    # Encode to AAC while recording so the merge is a remux
                     "-c:a",
-                    "pcm_s16le",
+                    "aac",
+                    "-b:a",
+                    "192k",
                     "-ar",
                     "48000",
                     "-ac",
@@ -143,13 +203,11 @@ except ImportError as e:
 
         def cleanup(self) -> None:
             if self.original_default_sink:
-                subprocess.run(
-                    ["pactl", "set-default-sink", self.original_default_sink]
-                )
+                subprocess.run([PACTL, "set-default-sink", self.original_default_sink])
             if self.loopback_module:
-                subprocess.run(["pactl", "unload-module", self.loopback_module])
+                subprocess.run([PACTL, "unload-module", self.loopback_module])
             if self.null_sink_module:
-                subprocess.run(["pactl", "unload-module", self.null_sink_module])
+                subprocess.run([PACTL, "unload-module", self.null_sink_module])
 
     def merge_audio_video(video_path: str, audio_path: str, output_path: str) -> bool:
         result = subprocess.run(
@@ -160,10 +218,11 @@ except ImportError as e:
                 video_path,
                 "-i",
                 audio_path,
-                "-c:v",
+                # Both streams are already in MP4-ready codecs, so just remux
+                "-c",
                 "copy",
-                "-c:a",
-                "aac",
+                "-movflags",
+                "+faststart",
                 output_path,
             ],
             stdout=subprocess.DEVNULL,
@@ -172,62 +231,336 @@ except ImportError as e:
         return result.returncode == 0
 
     def get_incremental_filename(base_name="output", extension=".mp4") -> str:
-        i = 1
-        while os.path.exists(f"{base_name}_{i}{extension}"):
-            i += 1
-        return f"{base_name}_{i}{extension}"
+        # One directory listing instead of a stat() per existing recording
+        pattern = re.compile(rf"{re.escape(base_name)}_(\d+){re.escape(extension)}")
+        existing = glob.glob(f"{glob.escape(base_name)}_*{glob.escape(extension)}")
+        numbers = [int(m.group(1)) for f in existing if (m := pattern.fullmatch(f))]
+        return f"{base_name}_{max(numbers, default=0) + 1}{extension}"
+
+    def _write_all(pipe, buffers) -> None:
+        """Write buffers to pipe with writev(), resuming after partial writes."""
+        if not hasattr(os, "writev"):
+            for buf in buffers:
+                pipe.write(buf)
+            return
+        fd = pipe.fileno()
+        views = [memoryview(buf).cast("B") for buf in buffers]
+        while views:
+            written = os.writev(fd, views)
+            while views and written >= len(views[0]):
+                written -= len(views.pop(0))
+            if views and written:
+                views[0] = views[0][written:]
+
+    _MSS = None
+
+    def _mss():
+        """Return the process-wide MSS instance, connecting to the display once."""
+        global _MSS
+        if _MSS is None:
+            _MSS = mss.mss()
+        return _MSS
 
     class ScreenRecorder:
+        # Hardware H.264 encoders in order of preference:
+        # name -> (global/input args, output args)
+        HW_ENCODERS = {
+            "h264_nvenc": ([], ["-preset", "p1"]),
+            "h264_vaapi": (
+                ["-vaapi_device", "/dev/dri/renderD128"],
+                ["-vf", "format=nv12,hwupload"],
+            ),
+            "h264_amf": ([], ["-quality", "speed"]),
+        }
+        # Encoders that would otherwise keep 4:4:4 chroma from RGB input,
+        # which most players can't decode
+        YUV420P_ENCODERS = ("h264_nvenc", "libx264")
+        _encoder: tuple[str, list[str], list[str]] | None = None
+        _encoder_probed = False
+
         def __init__(self, fps: float, monitor_index: int = 1):
             self.fps = fps
             self.monitor_index = monitor_index
             self.recording = False
-            self.output_file = f"screen_{int(time.time())}.avi"
+            self.output_file = f"screen_{int(time.time())}.mkv"
+            self._monitor: dict | None = None
+            self._camera = None
 
         def _get_screen_size(self) -> tuple[int, int]:
-            with mss.mss() as sct:
-                mon = sct.monitors[self.monitor_index]
-                return mon["width"], mon["height"]
+            if self._camera is None and dxcam is not None:
+                try:
+                    self._camera = dxcam.create(
+                        output_idx=self.monitor_index - 1, output_color="BGRA"
+                    )
+                except Exception:
+                    self._camera = None  # Fall back to MSS
+            if self._camera is not None:
+                return self._camera.width, self._camera.height
+            if self._monitor is None:
+                self._monitor = _mss().monitors[self.monitor_index]
+            return self._monitor["width"], self._monitor["height"]
+
+        def _frame_grabber(self):
+            """Return a callable producing one BGRA frame buffer per call."""
+            if self._camera is None:
+                sct, monitor = _mss(), self._monitor
+                return lambda: sct.grab(monitor).raw
+
+            camera = self._camera
+            last_frame = None
+
+            def grab():
+                # DXGI returns None when the screen hasn't changed, so repeat
+                # the previous frame to keep the output at a constant rate
+                nonlocal last_frame
+                frame = camera.grab()
+                if frame is not None:
+                    last_frame = frame
+                return last_frame
+
+            return grab
+
+        @classmethod
+        def _probe_encoder(cls) -> tuple[str, list[str], list[str]] | None:
+            """Pick the first working FFmpeg H.264 encoder, GPU first."""
+            if cls._encoder_probed:
+                return cls._encoder
+            cls._encoder_probed = True
+
+            try:
+                listing = subprocess.run(
+                    ["ffmpeg", "-hide_banner", "-encoders"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5,
+                ).stdout
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                return None
+
+            candidates = [(name, *args) for name, args in cls.HW_ENCODERS.items()] + [
+                ("libx264", [], ["-preset", "ultrafast"])
+            ]
+            for name, pre_args, post_args in candidates:
+                if f" {name} " not in listing:
+                    continue
+                # Listed encoders may still lack a usable device, so try one frame
+                try:
+                    probe = subprocess.run(
+                        ["ffmpeg", "-hide_banner", "-loglevel", "error", *pre_args]
+                        + ["-f", "lavfi", "-i", "color=s=256x256", "-frames:v", "1"]
+                        + ["-c:v", name, *post_args, "-f", "null", "-"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=10,
+                    )
+                except subprocess.TimeoutExpired:
+                    continue
+                if probe.returncode == 0:
+                    cls._encoder = (name, pre_args, post_args)
+                    break
+            return cls._encoder
+
+        def _spawn_ffmpeg_encoder(
+            self, w: int, h: int, pix_fmt: str
+        ) -> subprocess.Popen | None:
+            encoder = self._probe_encoder()
+            if encoder is None:
+                return None
+            name, pre_args, post_args = encoder
+            if pix_fmt != "yuv420p" and name in self.YUV420P_ENCODERS:
+                post_args = [*post_args, "-pix_fmt", "yuv420p"]
+            cmd = [
+                "ffmpeg",
+                "-y",
+                "-loglevel",
+                "error",
+                *pre_args,
+                "-f",
+                "rawvideo",
+                "-pix_fmt",
+                pix_fmt,
+                "-s",
+                f"{w}x{h}",
+                "-r",
+                str(self.fps),
+                "-i",
+                "-",
+                "-c:v",
+                name,
+                *post_args,
+                "-f",
+                "matroska",
+                self.output_file,
+            ]
+            # Unbuffered: frames are written whole, a BufferedWriter would
+            # only add another copy
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, bufsize=0)
+            if fcntl is not None and hasattr(fcntl, "F_SETPIPE_SZ"):
+                try:
+                    # Default 64 KiB pipes make the writer block many times
+                    # per frame; 1 MiB is the unprivileged maximum
+                    fcntl.fcntl(proc.stdin.fileno(), fcntl.F_SETPIPE_SZ, 1 << 20)
+                except OSError:
+                    pass
+            return proc
 
         def start_recording(self) -> str:
             self.recording = True
             screen_size = self._get_screen_size()
-            out = cv2.VideoWriter(
-                self.output_file, cv2.VideoWriter_fourcc(*"XVID"), self.fps, screen_size
-            )
+            w, h = screen_size
+            # Convert in-process when Numba is available so FFmpeg gets 12 bpp
+            # instead of 32 bpp and skips swscale; YUV420P needs even sizes
+            pix_fmt = "bgra"
+            if bgra_to_yuv420p is not None and w % 2 == 0 and h % 2 == 0:
+                pix_fmt = "yuv420p"
+                # JIT up front so the first frame doesn't stall the encoder
+                bgra_to_yuv420p(
+                    np.zeros((2, 2, 4), np.uint8),
+                    np.empty((2, 2), np.uint8),
+                    np.empty((1, 1), np.uint8),
+                    np.empty((1, 1), np.uint8),
+                )
+            proc = self._spawn_ffmpeg_encoder(w, h, pix_fmt)
+            out = None
+            if proc is None:
+                # No usable FFmpeg encoder, fall back to OpenCV
+                self.output_file = self.output_file.replace(".mkv", ".avi")
+                out = cv2.VideoWriter(
+                    self.output_file,
+                    cv2.VideoWriter_fourcc(*"XVID"),
+                    self.fps,
+                    screen_size,
+                )
             delay = 1.0 / self.fps
+            grab = self._frame_grabber()
+
+            # Bounded so a stalled encoder backpressures the grabber
+            # instead of buffering frames without limit
+            frames: queue.Queue = queue.Queue(maxsize=3)
+            encoder = threading.Thread(
+                target=self._encode_frames,
+                args=(frames, proc, out, screen_size, pix_fmt),
+                daemon=True,
+            )
+            encoder.start()
 
-            with mss.mss() as sct:
-                monitor = sct.monitors[self.monitor_index]
+            try:
+                next_tick = time.monotonic()
                 while self.recording:
-                    frame_start = time.time()
-                    frame = np.array(sct.grab(monitor))[:, :, :3]
-                    out.write(frame)
+                    # Hand the capture buffer itself over, no copy on this side
+                    buf = grab()
+                    if buf is not None:
+                        frames.put(buf)
+
+                    # Sleep until the next fixed tick so grab latency doesn't drift
+                    next_tick += delay
+                    sleep_for = next_tick - time.monotonic()
+                    if sleep_for > 0:
+                        time.sleep(sleep_for)
+                    else:
+                        # Behind schedule, resync instead of bursting to catch up
+                        next_tick = time.monotonic()
+            finally:
+                frames.put(None)
+                if self._camera is not None:
+                    self._camera.release()
+                    self._camera = None
+
+            encoder.join()
+            return self.output_file
 
-                    # Ensure consistent frame timing
-                    frame_time = time.time() - frame_start
-                    sleep_time = max(0.0, delay - frame_time)
-                    if sleep_time > 0:
-                        time.sleep(sleep_time)
+        def _encode_frames(
+            self,
+            frames: queue.Queue,
+            proc: subprocess.Popen | None,
+            out,
+            screen_size: tuple[int, int],
+            pix_fmt: str,
+        ) -> None:
+            w, h = screen_size
+            if out is not None:
+                # Reused destination for the OpenCV path's alpha drop
+                bgr = np.empty((h, w, 3), np.uint8)
+            elif pix_fmt == "yuv420p":
+                # Planes are allocated once and reused for every frame
+                planes = (
+                    np.empty((h, w), np.uint8),
+                    np.empty((h // 2, w // 2), np.uint8),
+                    np.empty((h // 2, w // 2), np.uint8),
+                )
+            try:
+                while (buf := frames.get()) is not None:
+                    if proc and pix_fmt == "bgra":
+                        # The capture's native BGRA layout is what FFmpeg
+                        # reads, so hand the buffer over and let FFmpeg convert
+                        _write_all(proc.stdin, [buf])
+                        continue
 
-            out.release()
-            return self.output_file
+                    # Only build an array view when a conversion needs one
+                    frame = np.frombuffer(buf, np.uint8).reshape(h, w, 4)
+                    if proc:
+                        bgra_to_yuv420p(frame, *planes)
+                        # One writev for all three planes
+                        _write_all(proc.stdin, planes)
+                    else:
+                        cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR, dst=bgr)
+                        out.write(bgr)
+            except Exception:
+                # Stop the grabber and drain so its blocking put() can't hang
+                self.recording = False
+                while frames.get() is not None:
+                    pass
+                raise
+            finally:
+                if proc:
+                    proc.stdin.close()
+                    proc.wait()
+                else:
+                    out.release()
 
         def stop(self) -> None:
             self.recording = False
 
-        def detect_screens(self) -> list[dict]:
-            with mss.mss() as sct:
-                monitors = sct.monitors
-                return [
-                    {
-                        "width": monitor["width"],
-                        "height": monitor["height"],
-                        "left": monitor["left"],
-                        "top": monitor["top"],
-                    }
-                    for monitor in monitors[1:]
-                ]
+        @staticmethod
+        def detect_screens() -> list[dict]:
+            return [
+                {
+                    "width": monitor["width"],
+                    "height": monitor["height"],
+                    "left": monitor["left"],
+                    "top": monitor["top"],
+                }
+                for monitor in _mss().monitors[1:]
+            ]
+
+    LABEL_STYLE = MappingProxyType({"bg": "#1e1e1e", "fg": "#ffffff"})
+    ENTRY_STYLE = MappingProxyType(
+        {"bg": "#2e2e2e", "fg": "#ffffff", "insertbackground": "white"}
+    )
+    BTN_STYLE = MappingProxyType(
+        {"bg": "#3a3a3a", "fg": "white", "activebackground": "#5a5a5a"}
+    )
+    CHECK_STYLE = MappingProxyType(
+        {
+            "bg": "#1e1e1e",
+            "fg": "#cccccc",
+            "selectcolor": "#2e2e2e",
+            "activebackground": "#333333",
+        }
+    )
+    APP_LIST = (
+        "Firefox",
+        "Chrome",
+        "chromium",
+        "zoom",
+        "Spotify",
+        "discord",
+        "obs",
+        "brave",
+    )
+    # Checkboxes sit two per row starting at row 3, controls go below them
+    APP_GRID = tuple((3 + idx // 2, idx % 2) for idx in range(len(APP_LIST)))
+    CONTROLS_ROW = 3 + len(APP_LIST) // 2
 
     class RecorderApp:
         def __init__(self, root: tk.Tk) -> None:
@@ -239,119 +572,94 @@ except ImportError as e:
             self.audio_capture: SystemAudioCapture | None = None
             self.audio_proc: subprocess.Popen | None = None
             self.video_file: str | None = None
-            self.audio_file = "audio.wav"
+            self.audio_file = "audio.m4a"
             self.final_file: str | None = None
             self.last_saved_recording: str | None = None
+            self._record_thread: threading.Thread | None = None
 
             self.app_checkboxes = {}
-            self.app_list = [
-                "Firefox",
-                "Chrome",
-                "chromium",
-                "zoom",
-                "Spotify",
-                "discord",
-                "obs",
-                "brave",
-            ]
 
             self.log_text = tk.StringVar(value="Ready - Running in basic mode")
 
             self._build_ui()
-            self.screens = ScreenRecorder(1).detect_screens()
+            self.screens = ScreenRecorder.detect_screens()
+            self._screen_options = tuple(
+                f"Screen {i + 1}: {s['width']}x{s['height']} at ({s['left']},{s['top']})"
+                for i, s in enumerate(self.screens)
+            )
             self.selected_screen_index = tk.IntVar(value=1)
             self._populate_screens()
 
         def _build_ui(self) -> None:
-            label_style = {"bg": "#1e1e1e", "fg": "#ffffff"}
-            entry_style = {
-                "bg": "#2e2e2e",
-                "fg": "#ffffff",
-                "insertbackground": "white",
-            }
-
-            tk.Label(self.root, text="FPS:", **label_style).grid(
+            tk.Label(self.root, text="FPS:", **LABEL_STYLE).grid(
                 row=0, column=0, sticky="w"
             )
-            self.fps_entry = tk.Entry(self.root, **entry_style)
+            self.fps_entry = tk.Entry(self.root, **ENTRY_STYLE)
             self.fps_entry.insert(0, "20")
             self.fps_entry.grid(row=0, column=1, sticky="w")
 
-            tk.Label(self.root, text="Capture Audio From:", **label_style).grid(
+            tk.Label(self.root, text="Capture Audio From:", **LABEL_STYLE).grid(
                 row=2, column=0, columnspan=2, sticky="w"
             )
-            for idx, app in enumerate(self.app_list):
+            for app, (row, column) in zip(APP_LIST, APP_GRID):
                 var = tk.BooleanVar(value=True)
-                chk = tk.Checkbutton(
-                    self.root,
-                    text=app,
-                    variable=var,
-                    bg="#1e1e1e",
-                    fg="#cccccc",
-                    selectcolor="#2e2e2e",
-                    activebackground="#333333",
-                )
-                chk.grid(row=3 + idx // 2, column=idx % 2, sticky="w")
+                chk = tk.Checkbutton(self.root, text=app, variable=var, **CHECK_STYLE)
+                chk.grid(row=row, column=column, sticky="w")
                 self.app_checkboxes[app] = var
 
-            self.status = tk.Label(self.root, textvariable=self.log_text, **label_style)
+            self.status = tk.Label(self.root, textvariable=self.log_text, **LABEL_STYLE)
             self.status.grid(
-                row=3 + len(self.app_list) // 2,
+                row=CONTROLS_ROW,
                 column=0,
                 columnspan=2,
                 pady=10,
                 sticky="w",
             )
 
-            btn_style = {"bg": "#3a3a3a", "fg": "white", "activebackground": "#5a5a5a"}
             tk.Button(
                 self.root,
                 text="Start Recording",
                 command=self.start_recording,
-                **btn_style,
-            ).grid(row=4 + len(self.app_list) // 2, column=0)
+                **BTN_STYLE,
+            ).grid(row=CONTROLS_ROW + 1, column=0)
             tk.Button(
                 self.root,
                 text="Stop Recording",
                 command=self.stop_recording,
-                **btn_style,
-            ).grid(row=4 + len(self.app_list) // 2, column=1)
+                **BTN_STYLE,
+            ).grid(row=CONTROLS_ROW + 1, column=1)
 
             tk.Button(
                 self.root,
                 text="Cancel Recording",
                 command=self.cancel_recording,
-                **btn_style,
-            ).grid(row=5 + len(self.app_list) // 2, column=0)
+                **BTN_STYLE,
+            ).grid(row=CONTROLS_ROW + 2, column=0)
 
             self.open_file_btn = tk.Button(
                 self.root,
                 text="📂 Open Recording",
                 command=self.open_last_recording,
-                **btn_style,
+                **BTN_STYLE,
                 state=tk.DISABLED,
             )
             self.open_file_btn.grid(
-                row=5 + len(self.app_list) // 2, column=1, columnspan=1, pady=5
+                row=CONTROLS_ROW + 2, column=1, columnspan=1, pady=5
             )
 
         def _populate_screens(self):
-            screen_options = [
-                f"Screen {i + 1}: {s['width']}x{s['height']} at ({s['left']},{s['top']})"
-                for i, s in enumerate(self.screens)
-            ]
             tk.Label(self.root, text="Select Screen:", bg="#1e1e1e", fg="white").grid(
                 row=1, column=0, sticky="w"
             )
             screen_menu = ttk.Combobox(
-                self.root, values=screen_options, state="readonly"
+                self.root, values=self._screen_options, state="readonly"
             )
             screen_menu.current(0)
             screen_menu.grid(row=1, column=1, sticky="w")
-            screen_menu.bind(
-                "<<ComboboxSelected>>",
-                lambda _: self.selected_screen_index.set(screen_menu.current() + 1),
-            )
+            screen_menu.bind("<<ComboboxSelected>>", self._on_screen_select)
+
+        def _on_screen_select(self, event) -> None:
+            self.selected_screen_index.set(event.widget.current() + 1)
 
         def _log(self, msg: str) -> None:
             print(msg)
@@ -379,7 +687,8 @@ except ImportError as e:
             def _record():
                 self.video_file = self.recorder.start_recording()
 
-            threading.Thread(target=_record, daemon=True).start()
+            self._record_thread = threading.Thread(target=_record, daemon=True)
+            self._record_thread.start()
             self._log("Recording...")
 
         def stop_recording(self) -> None:
@@ -387,27 +696,40 @@ except ImportError as e:
                 self.recorder.stop()
             if self.audio_proc:
                 self.audio_proc.terminate()
-                self.audio_proc.wait()
+            self._log("Stopping...")
+            self._poll_recording_stopped()
+
+        def _poll_recording_stopped(self) -> None:
+            """Wait for FFmpeg and the capture thread without blocking Tk."""
+            audio_running = self.audio_proc and self.audio_proc.poll() is None
+            video_running = self._record_thread and self._record_thread.is_alive()
+            if audio_running or video_running:
+                self.root.after(50, self._poll_recording_stopped)
+                return
+
             if self.audio_capture:
                 self.audio_capture.cleanup()
-
             if self.video_file:
-                default_name = get_incremental_filename()
-                success = merge_audio_video(
-                    self.video_file, self.audio_file, default_name
-                )
-                if success:
-                    self.final_file = default_name
-                    self.last_saved_recording = default_name
-                    self.open_file_btn.config(state=tk.NORMAL)
-                    self._log(f"Recording saved as {self.final_file}")
-                    for f in [self.video_file, self.audio_file]:
-                        try:
-                            os.remove(f)
-                        except Exception as e:
-                            self._log(f"Error deleting file {f}: {e}")
-                else:
-                    self._log("Failed to merge audio and video files.")
+                threading.Thread(target=self._finalize_merge, daemon=True).start()
+
+        def _finalize_merge(self) -> None:
+            default_name = get_incremental_filename()
+            success = merge_audio_video(self.video_file, self.audio_file, default_name)
+            self.root.after(0, self._on_merge_done, default_name, success)
+
+        def _on_merge_done(self, default_name: str, success: bool) -> None:
+            if success:
+                self.final_file = default_name
+                self.last_saved_recording = default_name
+                self.open_file_btn.config(state=tk.NORMAL)
+                self._log(f"Recording saved as {self.final_file}")
+                for f in filter(None, [self.video_file, self.audio_file]):
+                    try:
+                        Path(f).unlink(missing_ok=True)
+                    except OSError as e:
+                        self._log(f"Error deleting file {f}: {e}")
+            else:
+                self._log("Failed to merge audio and video files.")
 
     def cancel_recording(self) -> None:
         """Cancel recording without saving."""
@@ -420,12 +742,11 @@ except ImportError as e:
             self.audio_capture.cleanup()
 
         # Clean up temp files without saving
-        for f in [self.video_file, self.audio_file]:
-            if f:
-                try:
-                    os.remove(f)
-                except Exception as e:
-                    self._log(f"Error deleting temp file {f}: {e}")
+        for f in filter(None, [self.video_file, self.audio_file]):
+            try:
+                Path(f).unlink(missing_ok=True)
+            except OSError as e:
+                self._log(f"Error deleting temp file {f}: {e}")
 
         self._log("Recording cancelled - no files saved")
 
@@ -435,7 +756,7 @@ except ImportError as e:
             messagebox.showwarning("No Recording", "No recording file to open.")
             return
 
-        if not os.path.exists(self.last_saved_recording):
+        if not Path(self.last_saved_recording).is_file():
             messagebox.showerror(
                 "File Not Found",
                 f"Recording file not found:\n{self.last_saved_recording}",
@@ -465,33 +786,28 @@ except ImportError as e:
                 else:
                     raise Exception(f"Command failed: {result.stderr}")
             else:  # Linux and other Unix-like systems
-                # Try multiple methods for Linux
-                methods = [
-                    ["xdg-open", self.last_saved_recording],
-                    ["gnome-open", self.last_saved_recording],
-                    ["kde-open", self.last_saved_recording],
-                    ["vlc", self.last_saved_recording],
-                    ["mpv", self.last_saved_recording],
-                ]
-
+                # Use the first opener that is installed; resolving it with
+                # shutil.which avoids forking for missing binaries, and the
+                # opener detaches on its own so there is nothing to poll
                 success = False
-                for method in methods:
+                for name in ["xdg-open", "gnome-open", "kde-open", "vlc", "mpv"]:
+                    path = shutil.which(name)
+                    if not path:
+                        continue
                     try:
-                        process = subprocess.Popen(
-                            method,
+                        subprocess.Popen(
+                            [path, self.last_saved_recording],
                             stdout=subprocess.DEVNULL,
                             stderr=subprocess.DEVNULL,
                             start_new_session=True,
                         )
-                        time.sleep(0.5)
-                        if process.poll() is None or process.returncode == 0:
-                            success = True
-                            self._log(
-                                f"Opened recording with {method[0]}: {os.path.basename(self.last_saved_recording)}"
-                            )
-                            break
-                    except (FileNotFoundError, Exception):
+                    except OSError:
                         continue
+                    success = True
+                    self._log(
+                        f"Opened recording with {name}: {os.path.basename(self.last_saved_recording)}"
+                    )
+                    break
 
                 if not success:
                     # Open folder as fallback
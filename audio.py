@@ -1,12 +1,30 @@
 """Audio capture functionality for the screen recorder."""
 
+import json
 import logging
-import signal
+import os
+import re
+import shutil
 import subprocess
+import tempfile
 import time
+import wave
 from collections.abc import Callable
 
-from utils import CallbackLogger
+from utils import CallbackLogger, get_file_size, safe_remove_file
+
+# Sink input id and application name of every block in `pactl list sink-inputs`
+# Matched on the raw bytes so only the captured fields need decoding
+SINK_INPUT_RE = re.compile(
+    rb"^Sink Input #(\d+)$(?:(?!^Sink Input #).)*?application\.name = \"([^\"]*)\"",
+    re.M | re.S,
+)
+
+# How long a sink input listing may be reused before pactl is asked again
+SINK_INPUTS_TTL = 0.5
+
+# How a pactl too old for JSON output rejects --format (getopt's wording)
+PACTL_UNKNOWN_OPTION_RE = re.compile(r"unrecognized option|invalid option")
 
 
 class AudioCaptureError(Exception):
@@ -18,6 +36,11 @@ class AudioCaptureError(Exception):
 class SystemAudioCapture:
     """Handles system audio capture using PulseAudio."""
 
+    # Whether pactl accepts --format=json (PulseAudio 16+), learned on first use
+    _json_supported: bool | None = None
+    # Absolute path of pactl, looked up once instead of on every spawn
+    _pactl_path: str | None = None
+
     def __init__(
         self,
         selected_apps: list[str],
@@ -29,52 +52,183 @@ class SystemAudioCapture:
         self.loopback_module: str | None = None
         self.original_default_sink: str | None = None
         self.apps_to_capture = selected_apps
+        # One case-insensitive pattern matches any selected app in a single pass
+        self._app_pattern = (
+            re.compile("|".join(map(re.escape, selected_apps)), re.IGNORECASE)
+            if selected_apps
+            else None
+        )
         self.sample_rate = sample_rate
         self.channels = channels
         self.is_setup = False
         self.recording_process: subprocess.Popen | None = None
+        self.output_file: str | None = None
+        # Files recorded so far, one per stretch between pauses
+        self._segments: list[str] = []
+        self._stderr_log = None
         self.paused = False
+        # Query output shared by the lookups made while setup() runs
+        self._pactl_cache: dict[str, bytes] | None = None
+        # Last sink input listing and when it was taken, for repeated lookups
+        self._sink_inputs_cache: tuple[float, list[dict]] | None = None
 
         # Set up logging
         self.logger = logging.getLogger(__name__)
         self.callback_logger = CallbackLogger(self.logger, log_callback)
 
-    def _run_pactl_command(
+    @classmethod
+    def _find_pactl(cls) -> str | None:
+        """Look up pactl's absolute path, caching it once found."""
+        if cls._pactl_path is None:
+            cls._pactl_path = shutil.which("pactl")
+        return cls._pactl_path
+
+    def _resolve_command(self, cmd: list[str]) -> list[str]:
+        """Return cmd with pactl replaced by its cached absolute path."""
+        if cmd[0] != "pactl":
+            return cmd
+        pactl_path = self._find_pactl()
+        if pactl_path is None:
+            raise AudioCaptureError(
+                "pactl command not found. Please install PulseAudio."
+            )
+        return [pactl_path, *cmd[1:]]
+
+    def _run_pactl_command_noraise(
         self, cmd: list[str], timeout: int = 10
-    ) -> subprocess.CompletedProcess:
-        """Run a pactl command with proper error handling."""
+    ) -> tuple[bool, subprocess.CompletedProcess | str]:
+        """Run a pactl command, returning (ok, result) or (False, error message).
+
+        For probes where failure is an expected answer rather than an error.
+        Output is left as bytes; callers decode only what they use.
+        """
+        if cmd[0] == "pactl" and self._find_pactl() is None:
+            return False, "pactl command not found. Please install PulseAudio."
+
         try:
+            # No fds need closing here, which lets subprocess use posix_spawn
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=timeout, check=True
+                self._resolve_command(cmd),
+                capture_output=True,
+                timeout=timeout,
+                close_fds=False,
             )
-            self.logger.debug(f"Command succeeded: {' '.join(cmd)}")
-            return result
         except subprocess.TimeoutExpired:
-            raise AudioCaptureError(f"Command timed out: {' '.join(cmd)}")
-        except subprocess.CalledProcessError as e:
-            raise AudioCaptureError(f"Command failed: {' '.join(cmd)} - {e.stderr}")
+            return False, f"Command timed out: {' '.join(cmd)}"
         except FileNotFoundError:
-            raise AudioCaptureError(
-                "pactl command not found. Please install PulseAudio."
+            return False, "pactl command not found. Please install PulseAudio."
+
+        if result.returncode != 0:
+            stderr = result.stderr.decode(errors="replace")
+            return False, f"Command failed: {' '.join(cmd)} - {stderr}"
+        self.logger.debug(f"Command succeeded: {' '.join(cmd)}")
+        return True, result
+
+    def _run_pactl_command(
+        self, cmd: list[str], timeout: int = 10
+    ) -> subprocess.CompletedProcess:
+        """Run a pactl command with proper error handling."""
+        ok, result = self._run_pactl_command_noraise(cmd, timeout)
+        if not ok:
+            raise AudioCaptureError(result)
+        return result
+
+    def _run_pactl_commands(
+        self, cmds: list[list[str]], timeout: int = 10
+    ) -> list[tuple[bool, subprocess.CompletedProcess | str]]:
+        """Run independent pactl commands at once.
+
+        Every process is started before any is waited on, so their round trips
+        to the sound server overlap. Each command gets the same (ok, result)
+        or (False, error message) answer as _run_pactl_command_noraise.
+        """
+        if cmds and self._find_pactl() is None:
+            return [
+                (False, "pactl command not found. Please install PulseAudio.")
+            ] * len(cmds)
+
+        processes = [
+            subprocess.Popen(
+                self._resolve_command(cmd),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                close_fds=False,
             )
+            for cmd in cmds
+        ]
 
-    def _check_pulseaudio_running(self) -> bool:
-        """Check if PulseAudio is running."""
+        results: list[tuple[bool, subprocess.CompletedProcess | str]] = []
+        for cmd, process in zip(cmds, processes, strict=True):
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                results.append((False, f"Command timed out: {' '.join(cmd)}"))
+                continue
+            if process.returncode != 0:
+                stderr = stderr.decode(errors="replace").strip()
+                results.append((False, f"Command failed: {' '.join(cmd)} - {stderr}"))
+            else:
+                self.logger.debug(f"Command succeeded: {' '.join(cmd)}")
+                results.append(
+                    (True, subprocess.CompletedProcess(cmd, 0, stdout, stderr))
+                )
+        return results
+
+    def _run_pactl_json(self, args: list[str]) -> list | dict | None:
+        """Run a pactl query with JSON output, or return None if unavailable."""
+        if SystemAudioCapture._json_supported is False:
+            return None
+
+        ok, result = self._run_pactl_command_noraise(["pactl", "--format=json", *args])
+        if not ok:
+            # Only a pactl that rejects the option is remembered; a server
+            # that is not up yet or a timeout may well pass on the next try
+            if PACTL_UNKNOWN_OPTION_RE.search(result):
+                SystemAudioCapture._json_supported = False
+            self.logger.debug(f"pactl JSON output unavailable, using text: {result}")
+            return None
         try:
-            self._run_pactl_command(["pactl", "info"])
-            return True
-        except AudioCaptureError:
-            return False
+            data = json.loads(result.stdout)
+        except json.JSONDecodeError as e:
+            self.logger.debug(f"pactl JSON output unreadable, using text: {e}")
+            SystemAudioCapture._json_supported = False
+            return None
+
+        SystemAudioCapture._json_supported = True
+        return data
+
+    def _check_pulseaudio_running(self, timeout: int = 10) -> bool:
+        """Check if PulseAudio is running."""
+        ok, _ = self._run_pactl_command_noraise(["pactl", "info"], timeout)
+        return ok
 
     def get_real_sink(self) -> str:
         """Get the real audio sink (not our virtual sink)."""
         try:
-            result = self._run_pactl_command(["pactl", "list", "short", "sinks"])
-            sinks = result.stdout.strip().splitlines()
+            sinks = None
+            if self._pactl_cache is not None:
+                output = self._pactl_cache["sinks"]
+            else:
+                sinks = self._run_pactl_json(["list", "short", "sinks"])
+                if sinks is None:
+                    output = self._run_pactl_command(
+                        ["pactl", "list", "short", "sinks"]
+                    ).stdout
+
+            if sinks is not None:
+                names = [sink.get("name", "") for sink in sinks]
+            else:
+                names = [
+                    line.split("\t")[1]
+                    for line in output.decode(errors="replace").strip().splitlines()
+                    if line.strip()
+                ]
 
-            for line in sinks:
-                if "record_sink" not in line and line.strip():
-                    return line.split("\t")[1]
+            for name in names:
+                if "record_sink" not in name and name:
+                    return name
 
             raise AudioCaptureError("No real audio sink found")
 
@@ -84,62 +238,70 @@ class SystemAudioCapture:
 
     def get_sink_inputs(self) -> list[dict]:
         """Get list of current sink inputs with their properties."""
-        try:
-            result = self._run_pactl_command(["pactl", "list", "sink-inputs"])
-            inputs = []
-
-            for block in result.stdout.split("Sink Input #")[
-                1:
-            ]:  # Skip first empty block
-                lines = block.strip().splitlines()
-                if not lines:
-                    continue
-
-                # Extract sink input ID
-                sink_input_id = lines[0].strip()
-
-                # Extract application name
-                app_name = None
-                for line in lines:
-                    if "application.name = " in line:
-                        app_name = line.split('application.name = "')[1].split('"')[0]
-                        break
-
-                if app_name:
-                    inputs.append({"id": sink_input_id, "app_name": app_name})
-
-            return inputs
-
-        except AudioCaptureError as e:
-            self.callback_logger.error(f"Failed to get sink inputs: {e}")
-            return []
+        now = time.monotonic()
+        if self._pactl_cache is not None:
+            output = self._pactl_cache["sink_inputs"]
+        elif (
+            self._sink_inputs_cache is not None
+            and now - self._sink_inputs_cache[0] < SINK_INPUTS_TTL
+        ):
+            return list(self._sink_inputs_cache[1])
+        else:
+            ok, result = self._run_pactl_command_noraise(
+                ["pactl", "list", "sink-inputs"]
+            )
+            if not ok:
+                self.callback_logger.error(f"Failed to get sink inputs: {result}")
+                return []
+            output = result.stdout
+
+        sink_inputs = [
+            {
+                "id": sink_input_id.decode(),
+                "app_name": app_name.decode(errors="replace"),
+            }
+            for sink_input_id, app_name in SINK_INPUT_RE.findall(output)
+            if app_name
+        ]
+        self._sink_inputs_cache = (now, sink_inputs)
+        return list(sink_inputs)
+
+    def invalidate_sink_inputs_cache(self) -> None:
+        """Make the next get_sink_inputs() query pactl again."""
+        self._sink_inputs_cache = None
 
     def move_apps_to_record_sink(self) -> int:
         """Move selected applications to the record sink."""
         moved_count = 0
-        sink_inputs = self.get_sink_inputs()
-
-        for sink_input in sink_inputs:
-            for app in self.apps_to_capture:
-                if app.lower() in sink_input["app_name"].lower():
-                    try:
-                        self._run_pactl_command(
-                            [
-                                "pactl",
-                                "move-sink-input",
-                                sink_input["id"],
-                                "record_sink",
-                            ]
-                        )
-                        self.callback_logger.info(
-                            f"Moved {sink_input['app_name']} to record sink"
-                        )
-                        moved_count += 1
-                        break
-                    except AudioCaptureError as e:
-                        self.callback_logger.warning(
-                            f"Failed to move {sink_input['app_name']}: {e}"
-                        )
+        app_pattern = self._app_pattern
+        if app_pattern is None:
+            self.callback_logger.warning("No matching applications found to capture")
+            return moved_count
+
+        matches = [
+            sink_input
+            for sink_input in self.get_sink_inputs()
+            if app_pattern.search(sink_input["app_name"])
+        ]
+
+        results = self._run_pactl_commands(
+            [
+                ["pactl", "move-sink-input", sink_input["id"], "record_sink"]
+                for sink_input in matches
+            ]
+        )
+        # The moves changed which sink each input is on
+        self.invalidate_sink_inputs_cache()
+        for sink_input, (ok, result) in zip(matches, results, strict=True):
+            if ok:
+                self.callback_logger.info(
+                    f"Moved {sink_input['app_name']} to record sink"
+                )
+                moved_count += 1
+            else:
+                self.callback_logger.warning(
+                    f"Failed to move {sink_input['app_name']}: {result}"
+                )
 
         if moved_count == 0:
             self.callback_logger.warning("No matching applications found to capture")
@@ -149,32 +311,58 @@ class SystemAudioCapture:
     def setup(self) -> bool:
         """Set up audio capture environment."""
         try:
-            if not self._check_pulseaudio_running():
+            # With JSON output one `pactl info` both proves the server is up
+            # and names the default sink, saving a process spawn
+            info = self._run_pactl_json(["info"])
+            if info is None and not self._check_pulseaudio_running():
                 raise AudioCaptureError("PulseAudio is not running")
 
             self.callback_logger.info("Setting up audio capture...")
 
             # Store original default sink
-            result = self._run_pactl_command(["pactl", "get-default-sink"])
-            self.original_default_sink = result.stdout.strip()
+            if info is not None:
+                self.original_default_sink = info.get("default_sink_name", "")
+            else:
+                result = self._run_pactl_command(["pactl", "get-default-sink"])
+                self.original_default_sink = result.stdout.decode().strip()
             self.callback_logger.debug(f"Original sink: {self.original_default_sink}")
 
-            # Create null sink for recording
-            result = self._run_pactl_command(
+            # Create null sink for recording. The sink and sink input
+            # listings don't depend on it, so they are fetched meanwhile and
+            # the lookups below read from those queries
+            (
+                (null_ok, null_result),
+                (sinks_ok, sinks_result),
+                (inputs_ok, inputs_result),
+            ) = self._run_pactl_commands(
                 [
-                    "pactl",
-                    "load-module",
-                    "module-null-sink",
-                    "sink_name=record_sink",
-                    f"rate={self.sample_rate}",
-                    f"channels={self.channels}",
-                    "sink_properties=device.description=RecordSink",
+                    [
+                        "pactl",
+                        "load-module",
+                        "module-null-sink",
+                        "sink_name=record_sink",
+                        f"rate={self.sample_rate}",
+                        f"channels={self.channels}",
+                        "sink_properties=device.description=RecordSink",
+                    ],
+                    ["pactl", "list", "short", "sinks"],
+                    ["pactl", "list", "sink-inputs"],
                 ]
             )
-            self.null_sink_module = result.stdout.strip()
+            if not null_ok:
+                raise AudioCaptureError(null_result)
+            self.null_sink_module = null_result.stdout.decode().strip()
             self.callback_logger.debug(
                 f"Created null sink module: {self.null_sink_module}"
             )
+            if not sinks_ok:
+                raise AudioCaptureError(sinks_result)
+            if not inputs_ok:
+                raise AudioCaptureError(inputs_result)
+            self._pactl_cache = {
+                "sinks": sinks_result.stdout,
+                "sink_inputs": inputs_result.stdout,
+            }
 
             # Get real sink for loopback
             real_sink = self.get_real_sink()
@@ -191,7 +379,7 @@ class SystemAudioCapture:
                     "latency_msec=50",
                 ]
             )
-            self.loopback_module = result.stdout.strip()
+            self.loopback_module = result.stdout.decode().strip()
             self.callback_logger.debug(
                 f"Created loopback module: {self.loopback_module}"
             )
@@ -215,40 +403,77 @@ class SystemAudioCapture:
             self.cleanup()  # Clean up any partial setup
             return False
 
+        finally:
+            # Later lookups must see the live state, not the setup snapshot
+            self._pactl_cache = None
+
+    def _spawn_recorder(self, output_file: str) -> subprocess.Popen:
+        """Start an ffmpeg process recording the record sink to a WAV file."""
+        # Use WAV format for better compatibility and no compression issues
+        cmd = [
+            "ffmpeg",
+            "-y",
+            # No progress output: nobody reads stderr while recording,
+            # and probing a PCM source only delays the start
+            "-loglevel",
+            "error",
+            "-nostats",
+            "-probesize",
+            "32",
+            "-analyzeduration",
+            "0",
+            # Fixed 10 ms s16 fragments keep pulse's callback rate at
+            # 100/s; the deeper queue lets a busy disk delay writes
+            # without dropping captured audio
+            "-thread_queue_size",
+            "1024",
+            "-fragment_size",
+            str(self.sample_rate * self.channels * 2 // 100),
+            "-f",
+            "pulse",
+            "-i",
+            "record_sink.monitor",
+            "-c:a",
+            "pcm_s16le",  # Uncompressed PCM audio
+            "-ar",
+            str(self.sample_rate),
+            "-ac",
+            str(self.channels),
+            output_file,
+        ]
+
+        # A leftover file would look like ffmpeg's output to the check below
+        safe_remove_file(output_file, self.logger)
+        # stderr is only read if startup fails; an unlinked temp file
+        # cannot fill up and block ffmpeg the way an unread pipe can
+        self._stderr_log = tempfile.TemporaryFile(mode="w+")
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=self._stderr_log)
+
+        # ffmpeg writes the WAV header once the pulse input is open, so
+        # stop waiting as soon as it appears or the process dies
+        deadline = time.monotonic() + 0.5
+        while proc.poll() is None and time.monotonic() < deadline:
+            if get_file_size(output_file) > 0:
+                break
+            time.sleep(0.02)
+        if proc.poll() is not None:
+            self._stderr_log.seek(0)
+            stderr = self._stderr_log.read().strip() or "Unknown error"
+            self._close_stderr_log()
+            raise AudioCaptureError(f"FFmpeg failed to start: {stderr}")
+
+        return proc
+
     def start_recording(self, output_file: str) -> subprocess.Popen | None:
         """Start audio recording."""
         if not self.is_setup:
             raise AudioCaptureError("Audio capture not set up. Call setup() first.")
 
         try:
-            # Use WAV format for better compatibility and no compression issues
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-f",
-                "pulse",
-                "-i",
-                "record_sink.monitor",
-                "-c:a",
-                "pcm_s16le",  # Uncompressed PCM audio
-                "-ar",
-                str(self.sample_rate),
-                "-ac",
-                str(self.channels),
-                output_file,
-            ]
-
-            proc = subprocess.Popen(
-                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
-            )
-
-            # Quick check if process started successfully
-            time.sleep(0.5)
-            if proc.poll() is not None:
-                stderr = proc.stderr.read() if proc.stderr else "Unknown error"
-                raise AudioCaptureError(f"FFmpeg failed to start: {stderr}")
-
+            proc = self._spawn_recorder(output_file)
             self.recording_process = proc
+            self.output_file = output_file
+            self._segments = [output_file]
             self.paused = False
             self.callback_logger.info("Audio recording started")
             return proc
@@ -257,56 +482,97 @@ class SystemAudioCapture:
             raise AudioCaptureError(f"Failed to start audio recording: {e}")
 
     def pause_recording(self) -> None:
-        """Pause/resume audio recording by sending SIGSTOP/SIGCONT to ffmpeg process."""
+        """Pause/resume audio recording, recording each active stretch separately.
+
+        Pausing ends the current ffmpeg process and resuming starts a new one
+        on a fresh segment file. A process frozen with SIGSTOP would leave the
+        sound server buffering everything played during the pause and replay
+        it into the recording on resume.
+        """
         if not self.recording_process:
             raise AudioCaptureError("No recording process to pause")
 
         try:
             if self.paused:
                 # Resume recording
-                self.recording_process.send_signal(signal.SIGCONT)
+                base, ext = os.path.splitext(self.output_file)
+                segment = f"{base}.part{len(self._segments)}{ext}"
+                self.recording_process = self._spawn_recorder(segment)
+                self._segments.append(segment)
                 self.paused = False
                 self.callback_logger.info("Audio recording resumed")
             else:
                 # Pause recording
-                self.recording_process.send_signal(signal.SIGSTOP)
+                self._terminate_recorder()
                 self.paused = True
                 self.callback_logger.info("Audio recording paused")
         except Exception as e:
             self.callback_logger.error(f"Failed to pause/resume audio recording: {e}")
             raise AudioCaptureError(f"Failed to pause/resume audio recording: {e}")
 
+    def _terminate_recorder(self) -> None:
+        """Ask the recording ffmpeg to finish its file, killing it if it hangs."""
+        self.callback_logger.info("Sending SIGTERM to audio recording process")
+        # Send SIGTERM first (gentler termination)
+        self.recording_process.terminate()
+
+        # Wait longer for audio recording to flush buffers properly
+        try:
+            self.recording_process.wait(timeout=8)
+            self.callback_logger.info("Audio recording stopped gracefully")
+        except subprocess.TimeoutExpired:
+            self.callback_logger.warning(
+                "Audio recording process did not terminate gracefully within 8 seconds, killing it"
+            )
+            self.recording_process.kill()
+            try:
+                self.recording_process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.callback_logger.error(
+                    "Audio recording process could not be killed"
+                )
+        finally:
+            self._close_stderr_log()
+
+    def _join_segments(self) -> None:
+        """Append the segments recorded after each resume to the output file."""
+        if len(self._segments) < 2:
+            return
+
+        joined_file = f"{self.output_file}.joined"
+        try:
+            with wave.open(joined_file, "wb") as joined:
+                for index, segment in enumerate(self._segments):
+                    with wave.open(segment, "rb") as part:
+                        if index == 0:
+                            joined.setparams(part.getparams())
+                        while frames := part.readframes(65536):
+                            joined.writeframesraw(frames)
+            os.replace(joined_file, self.output_file)
+        except (OSError, wave.Error, EOFError) as e:
+            # Keep every part, so nothing recorded after a pause is lost
+            self.callback_logger.error(
+                f"Failed to join audio segments ({e}), keeping them: "
+                f"{', '.join(self._segments)}"
+            )
+            safe_remove_file(joined_file, self.logger)
+            return
+
+        self.callback_logger.info(
+            f"Joined {len(self._segments)} audio segments around pauses"
+        )
+        for segment in self._segments[1:]:
+            safe_remove_file(segment, self.logger)
+        self._segments = [self.output_file]
+
     def stop_recording(self) -> None:
         """Stop the audio recording process."""
         if self.recording_process:
             try:
-                # If paused, resume first so it can terminate properly
-                if self.paused:
-                    self.callback_logger.info(
-                        "Resuming paused audio recording before stopping"
-                    )
-                    self.recording_process.send_signal(signal.SIGCONT)
-                    time.sleep(0.2)
-
-                self.callback_logger.info("Sending SIGTERM to audio recording process")
-                # Send SIGTERM first (gentler termination)
-                self.recording_process.terminate()
-
-                # Wait longer for audio recording to flush buffers properly
-                try:
-                    self.recording_process.wait(timeout=8)
-                    self.callback_logger.info("Audio recording stopped gracefully")
-                except subprocess.TimeoutExpired:
-                    self.callback_logger.warning(
-                        "Audio recording process did not terminate gracefully within 8 seconds, killing it"
-                    )
-                    self.recording_process.kill()
-                    try:
-                        self.recording_process.wait(timeout=2)
-                    except subprocess.TimeoutExpired:
-                        self.callback_logger.error(
-                            "Audio recording process could not be killed"
-                        )
+                # While paused the last segment's process has already finished
+                if not self.paused:
+                    self._terminate_recorder()
+                self._join_segments()
 
             except Exception as e:
                 self.callback_logger.error(f"Error stopping audio recording: {e}")
@@ -319,6 +585,13 @@ class SystemAudioCapture:
             finally:
                 self.recording_process = None
                 self.paused = False
+                self._close_stderr_log()
+
+    def _close_stderr_log(self) -> None:
+        """Discard the recording process's stderr file."""
+        if self._stderr_log is not None:
+            self._stderr_log.close()
+            self._stderr_log = None
 
     def cleanup(self) -> bool:
         """Clean up audio capture environment."""
@@ -328,29 +601,47 @@ class SystemAudioCapture:
             # No need to restore default sink since we never changed it
             self.callback_logger.debug("Default sink unchanged - no restoration needed")
 
-            # Unload loopback module
-            if self.loopback_module:
-                try:
-                    self._run_pactl_command(
-                        ["pactl", "unload-module", self.loopback_module]
-                    )
-                    self.callback_logger.debug("Unloaded loopback module")
-                except AudioCaptureError as e:
-                    self.callback_logger.warning(
-                        f"Failed to unload loopback module: {e}"
-                    )
-                    success = False
-
-            # Unload null sink module
-            if self.null_sink_module:
-                try:
-                    self._run_pactl_command(
-                        ["pactl", "unload-module", self.null_sink_module]
+            modules = {
+                label: module_id
+                for label, module_id in (
+                    ("loopback", self.loopback_module),
+                    ("null sink", self.null_sink_module),
+                )
+                if module_id
+            }
+
+            # Modules die with the server, and every unload would otherwise
+            # wait out its own timeout against a server that is gone
+            if modules and not self._check_pulseaudio_running(timeout=2):
+                self.callback_logger.warning(
+                    "PulseAudio is not running; its modules are already gone"
+                )
+                modules = {}
+
+            results = self._run_pactl_commands(
+                [
+                    ["pactl", "unload-module", module_id]
+                    for module_id in modules.values()
+                ]
+            )
+            errors = {
+                label: None if ok else result
+                for label, (ok, result) in zip(modules, results, strict=True)
+            }
+
+            # Removing the null sink can take the loopback reading its monitor
+            # down with it, so a failed unload only counts if the module stayed
+            still_loaded = self._loaded_module_ids() if any(errors.values()) else set()
+            for label, error in errors.items():
+                if error is None:
+                    self.callback_logger.debug(f"Unloaded {label} module")
+                elif modules[label] not in still_loaded:
+                    self.callback_logger.debug(
+                        f"{label.capitalize()} module already gone"
                     )
-                    self.callback_logger.debug("Unloaded null sink module")
-                except AudioCaptureError as e:
+                else:
                     self.callback_logger.warning(
-                        f"Failed to unload null sink module: {e}"
+                        f"Failed to unload {label} module: {error}"
                     )
                     success = False
 
@@ -371,6 +662,17 @@ class SystemAudioCapture:
             self.callback_logger.error(f"Unexpected error during cleanup: {e}")
             return False
 
+    def _loaded_module_ids(self) -> set[str]:
+        """Get the ids of the currently loaded PulseAudio modules."""
+        try:
+            result = self._run_pactl_command(["pactl", "list", "short", "modules"])
+        except AudioCaptureError:
+            # Cannot tell, so assume nothing was unloaded
+            return {self.loopback_module, self.null_sink_module} - {None}
+        return {
+            line.split(b"\t")[0].decode() for line in result.stdout.splitlines() if line
+        }
+
     def get_available_applications(self) -> list[str]:
         """Get list of currently running applications that can be captured."""
         try:
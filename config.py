@@ -2,8 +2,16 @@
 
 import json
 import logging
-from dataclasses import asdict, dataclass, fields
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 @dataclass
@@ -12,7 +20,7 @@ class RecorderConfig:
 
     # Video settings
     fps: float = 20.0
-    video_codec: str = "XVID"
+    video_codec: str = "H264"
     video_quality: int = 95
     output_format: str = "mp4"
 
@@ -54,6 +62,49 @@ class RecorderConfig:
             self.output_directory = str(Path.home() / "Videos" / "ScreenRecorder")
 
 
+# Field names read back from the config file, resolved once at import
+CONFIG_FIELDS = tuple(field.name for field in fields(RecorderConfig))
+
+# Fixed choices, built once rather than on every validation or menu refresh
+VALID_SAMPLE_RATES = frozenset({22050, 44100, 48000, 96000})
+VALID_CHANNELS = frozenset({1, 2})
+AVAILABLE_APPS = (
+    "Firefox",
+    "Chrome",
+    "Chromium",
+    "Brave",
+    "Safari",
+    "zoom",
+    "Teams",
+    "Skype",
+    "Discord",
+    "Slack",
+    "Spotify",
+    "VLC",
+    "MPV",
+    "Rhythmbox",
+    "obs",
+    "OBS Studio",
+    "Kdenlive",
+    "Audacity",
+    "Code",
+    "VSCode",
+    "PyCharm",
+    "Atom",
+)
+VIDEO_CODECS = MappingProxyType(
+    {
+        "XVID": "XVID (AVI)",
+        "MJPG": "Motion JPEG (AVI)",
+        "mp4v": "MPEG-4 (MP4)",
+        "H264": "H.264 (FFmpeg, hardware accelerated when available)",
+        "VP80": "VP8 (WebM)",
+        "VP90": "VP9 (WebM)",
+    }
+)
+OUTPUT_FORMATS = ("mp4", "avi", "mkv", "webm", "mov")
+
+
 class ConfigManager:
     """Manages configuration loading, saving, and validation."""
 
@@ -62,20 +113,28 @@ class ConfigManager:
         self.config = RecorderConfig()
         self.logger = logging.getLogger(__name__)
 
-    def load_config(self) -> RecorderConfig:
-        """Load configuration from file."""
+    def load_config(self, ensure_default_on_disk: bool = False) -> RecorderConfig:
+        """Load configuration from file.
+
+        Defaults are only written out for a missing file when
+        ensure_default_on_disk is set; otherwise the first save creates it.
+        """
         try:
             if self.config_file.exists():
-                with open(self.config_file) as f:
-                    data = json.load(f)
-                    # Update config with loaded data
-                    for field in fields(RecorderConfig):
-                        if field.name in data:
-                            setattr(self.config, field.name, data[field.name])
+                if orjson is not None:
+                    data = orjson.loads(self.config_file.read_bytes())
+                else:
+                    with open(self.config_file) as f:
+                        data = json.load(f)
+                # Update config with loaded data
+                for name in CONFIG_FIELDS:
+                    if name in data:
+                        setattr(self.config, name, data[name])
                 self.logger.info(f"Configuration loaded from {self.config_file}")
             else:
                 self.logger.info("No config file found, using defaults")
-                self.save_config()  # Save default config
+                if ensure_default_on_disk:
+                    self.save_config()  # Save default config
         except Exception as e:
             self.logger.error(f"Error loading config: {e}")
             self.config = RecorderConfig()  # Reset to defaults
@@ -88,8 +147,18 @@ class ConfigManager:
             # Ensure config directory exists
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.config_file, "w") as f:
-                json.dump(asdict(self.config), f, indent=2)
+            # RecorderConfig holds no nested dataclasses, so its __dict__ can
+            # be written as is instead of deep-copied through asdict()
+            if orjson is not None:
+                data = orjson.dumps(self.config.__dict__, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.config.__dict__, indent=2).encode()
+
+            # Written whole to a sibling file and renamed over the old one, so
+            # a crash mid-save never leaves a truncated config behind
+            tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.config_file)
             self.logger.info(f"Configuration saved to {self.config_file}")
             return True
         except Exception as e:
@@ -106,10 +175,10 @@ class ConfigManager:
         if self.config.video_quality < 1 or self.config.video_quality > 100:
             issues.append("Video quality must be between 1 and 100")
 
-        if self.config.audio_sample_rate not in [22050, 44100, 48000, 96000]:
+        if self.config.audio_sample_rate not in VALID_SAMPLE_RATES:
             issues.append("Audio sample rate must be 22050, 44100, 48000, or 96000")
 
-        if self.config.audio_channels not in [1, 2]:
+        if self.config.audio_channels not in VALID_CHANNELS:
             issues.append("Audio channels must be 1 (mono) or 2 (stereo)")
 
         if self.config.audio_delay_ms < -1000 or self.config.audio_delay_ms > 1000:
@@ -125,47 +194,17 @@ class ConfigManager:
 
         return issues
 
-    def get_available_apps(self) -> list[str]:
+    def get_available_apps(self) -> tuple[str, ...]:
         """Get list of common applications that can be recorded."""
-        return [
-            "Firefox",
-            "Chrome",
-            "Chromium",
-            "Brave",
-            "Safari",
-            "zoom",
-            "Teams",
-            "Skype",
-            "Discord",
-            "Slack",
-            "Spotify",
-            "VLC",
-            "MPV",
-            "Rhythmbox",
-            "obs",
-            "OBS Studio",
-            "Kdenlive",
-            "Audacity",
-            "Code",
-            "VSCode",
-            "PyCharm",
-            "Atom",
-        ]
-
-    def get_video_codecs(self) -> dict[str, str]:
+        return AVAILABLE_APPS
+
+    def get_video_codecs(self) -> Mapping[str, str]:
         """Get available video codecs."""
-        return {
-            "XVID": "XVID (AVI)",
-            "MJPG": "Motion JPEG (AVI)",
-            "mp4v": "MPEG-4 (MP4)",
-            "H264": "H.264 (MP4)",
-            "VP80": "VP8 (WebM)",
-            "VP90": "VP9 (WebM)",
-        }
-
-    def get_output_formats(self) -> list[str]:
+        return VIDEO_CODECS
+
+    def get_output_formats(self) -> tuple[str, ...]:
         """Get available output formats."""
-        return ["mp4", "avi", "mkv", "webm", "mov"]
+        return OUTPUT_FORMATS
 
     def reset_to_defaults(self):
         """Reset configuration to default values."""
@@ -16,10 +16,15 @@ def cleanup_audio_file():
         os.remove(AUDIO_FILE)
 
 
-def test_monitor_exists():
+@pytest.fixture(scope="session")
+def pactl_sources():
+    """List the PulseAudio sources once for the whole test session."""
+    return subprocess.check_output(["pactl", "list", "short", "sources"]).decode()
+
+
+def test_monitor_exists(pactl_sources):
     """Check if record_sink.monitor exists"""
-    output = subprocess.check_output(["pactl", "list", "short", "sources"]).decode()
-    assert MONITOR_NAME in output, (
+    assert MONITOR_NAME in pactl_sources, (
         f"{MONITOR_NAME} not found. Make sure 'record_sink' is loaded."
     )
 
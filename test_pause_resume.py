@@ -3,7 +3,9 @@
 
 import os
 import sys
+import tempfile
 import time
+import wave
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
@@ -88,12 +90,51 @@ def test_audio_pause_resume():
         return True  # This is expected in test environment
 
 
+def _write_wav(path, frame_count):
+    """Write a short mono 16-bit WAV of silence."""
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(8000)
+        wav.writeframes(b"\x00\x00" * frame_count)
+
+
+def test_audio_segments_join():
+    """Test that segments recorded around a pause are joined into one WAV."""
+    with tempfile.TemporaryDirectory() as tmp:
+        first = os.path.join(tmp, "audio.wav")
+        second = os.path.join(tmp, "audio.part1.wav")
+        _write_wav(first, 800)
+        _write_wav(second, 1200)
+
+        audio_capture = SystemAudioCapture(["test-app"])
+        audio_capture.output_file = first
+        audio_capture._segments = [first, second]
+        audio_capture._join_segments()
+
+        with wave.open(first, "rb") as joined:
+            assert joined.getnframes() == 2000
+        assert not os.path.exists(second)
+
+        # A part that can't be read leaves every segment in place
+        with open(second, "wb") as broken:
+            broken.write(b"not a wav")
+        audio_capture._segments = [first, second]
+        audio_capture._join_segments()
+
+        assert os.path.exists(second)
+        with wave.open(first, "rb") as kept:
+            assert kept.getnframes() == 2000
+
+
 def main():
     """Run all tests."""
     print("=== Testing Pause/Resume Functionality ===\n")
 
     video_result = test_video_pause_resume()
     audio_result = test_audio_pause_resume()
+    test_audio_segments_join()
+    print("✓ Audio segments joined")
 
     print("\n=== Test Results ===")
     print(f"Video pause/resume: {'✓ PASS' if video_result else '✗ FAIL'}")
@@ -1,17 +1,27 @@
 """Enhanced UI for the screen recorder with better UX and controls."""
 
+import os
+import platform
+import re
 import subprocess
+import threading
+import time
 import tkinter as tk
+import traceback
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
+from types import MappingProxyType
 
 from audio import AudioCaptureError, SystemAudioCapture
 from config import ConfigManager
 from utils import (
     RecordingTimer,
     check_dependencies,
+    get_file_size,
     get_incremental_filename,
+    move_file,
     setup_logging,
+    stat_file,
     validate_fps,
 )
 from video import (
@@ -19,8 +29,36 @@ from video import (
     VideoCaptureError,
     cleanup_temp_files,
     merge_audio_video,
+    schedule_cleanup,
 )
 
+# Widget styles shared by every window, built once and read-only
+LABEL_STYLE = MappingProxyType({"bg": "#1e1e1e", "fg": "#ffffff"})
+ENTRY_STYLE = MappingProxyType(
+    {"bg": "#2e2e2e", "fg": "#ffffff", "insertbackground": "white"}
+)
+BUTTON_STYLE = MappingProxyType(
+    {"bg": "#3a3a3a", "fg": "white", "activebackground": "#5a5a5a"}
+)
+
+# ttk styles for the dark frames and labels; the theme engine keeps one
+# copy of each instead of every widget carrying its own colors
+DARK_FRAME_STYLE = "Dark.TFrame"
+DARK_LABEL_STYLE = "Dark.TLabel"
+
+# What the FPS entry may hold while being typed: up to three digits and an
+# optional fractional part
+FPS_INPUT_RE = re.compile(r"\d{0,3}(?:\.\d*)?")
+
+
+def _ensure_dark_styles(widget: tk.Misc):
+    """Register the dark ttk styles with the widget's Tk, unless already done."""
+    style = ttk.Style(widget)
+    if style.lookup(DARK_FRAME_STYLE, "background"):
+        return
+    style.configure(DARK_FRAME_STYLE, background="#1e1e1e")
+    style.configure(DARK_LABEL_STYLE, background="#1e1e1e", foreground="#ffffff")
+
 
 class ProgressWindow:
     """Separate window showing recording progress."""
@@ -37,34 +75,46 @@ class ProgressWindow:
         # Make window stay on top
         self.window.attributes("-topmost", True)
 
+        # Last values shown, so unchanged ones don't reconfigure their widgets
+        self._last_info = ""
+        self._paused_state = False
+        self._tick_job = None
+
+        _ensure_dark_styles(self.window)
         self._setup_ui()
-        self._update_progress()
+        self.timer.bind_display(self.time_var)
+        self._tick()
+        self.timer.register_listener(self._on_timer_change)
 
     def _setup_ui(self):
         """Set up the progress window UI."""
-        style = {"bg": "#1e1e1e", "fg": "#ffffff"}
-
         # Status label
-        self.status_label = tk.Label(
-            self.window, text="🔴 RECORDING", font=("Arial", 12), **style
+        self.status_label = ttk.Label(
+            self.window, text="🔴 RECORDING", font=("Arial", 12), style=DARK_LABEL_STYLE
         )
         self.status_label.pack(pady=10)
 
-        # Time label
-        self.time_label = tk.Label(
-            self.window, text="00:00:00", font=("Arial", 20, "bold"), **style
+        # Time label, redrawn by Tk only when the timer writes a new value
+        self.time_var = tk.StringVar(value="00:00:00")
+        self.time_label = ttk.Label(
+            self.window,
+            textvariable=self.time_var,
+            font=("Arial", 20, "bold"),
+            style=DARK_LABEL_STYLE,
         )
         self.time_label.pack(pady=10)
 
         # Progress info
-        self.info_label = tk.Label(self.window, text="", font=("Arial", 10), **style)
+        self.info_label = ttk.Label(
+            self.window, text="", font=("Arial", 10), style=DARK_LABEL_STYLE
+        )
         self.info_label.pack(pady=5)
 
         # Control buttons
-        button_frame = tk.Frame(self.window, bg="#1e1e1e")
+        button_frame = ttk.Frame(self.window, style=DARK_FRAME_STYLE)
         button_frame.pack(pady=10)
 
-        btn_style = {"bg": "#3a3a3a", "fg": "white", "activebackground": "#5a5a5a"}
+        btn_style = BUTTON_STYLE
 
         self.pause_btn = tk.Button(button_frame, text="⏸️ Pause", **btn_style)
         self.pause_btn.pack(side=tk.LEFT, padx=5)
@@ -75,21 +125,39 @@ class ProgressWindow:
         self.cancel_btn = tk.Button(button_frame, text="❌ Cancel", **btn_style)
         self.cancel_btn.pack(side=tk.LEFT, padx=5)
 
-    def _update_progress(self):
-        """Update progress display."""
-        if self.timer.is_running:
-            elapsed = self.timer.get_formatted_elapsed()
-            self.time_label.config(text=elapsed)
+    def _on_timer_change(self, elapsed: str):
+        """Restart or end the ticks when the timer changes state."""
+        # The timer is stopped from worker threads; the Tk loop redraws
+        if threading.current_thread() is not threading.main_thread():
+            self.window.after(0, self._tick)
+        else:
+            self._tick()
+
+    def _tick(self):
+        """Refresh the time display and schedule the next tick."""
+        if self._tick_job is not None:
+            self.window.after_cancel(self._tick_job)
+            self._tick_job = None
+
+        self.timer.refresh_display()
 
-            # Schedule next update
-            self.window.after(1000, self._update_progress)
+        # A paused or stopped timer doesn't change, so only a running one
+        # ticks, each time as the elapsed time reaches a whole second
+        if self.timer.is_running and not self.timer.is_paused:
+            delay_ms = int(self.timer.seconds_to_next_tick() * 1000) + 1
+            self._tick_job = self.window.after(delay_ms, self._tick)
 
     def update_info(self, text: str):
         """Update the info label."""
-        self.info_label.config(text=text)
+        if text != self._last_info:
+            self.info_label.config(text=text)
+            self._last_info = text
 
     def set_paused(self, paused: bool):
         """Update UI for pause state."""
+        if paused == self._paused_state:
+            return
+        self._paused_state = paused
         if paused:
             self.status_label.config(text="⏸️ PAUSED")
             self.pause_btn.config(text="▶️ Resume")
@@ -99,6 +167,8 @@ class ProgressWindow:
 
     def close(self):
         """Close the progress window."""
+        self.timer.unregister_listener(self._on_timer_change)
+        self.timer.bind_display(None)
         self.window.destroy()
 
 
@@ -128,15 +198,17 @@ class ProcessingProgressWindow:
         )
         self.window.geometry(f"+{x}+{y}")
 
+        _ensure_dark_styles(self.window)
         self._setup_ui()
 
     def _setup_ui(self):
         """Set up the processing progress window UI."""
-        style = {"bg": "#1e1e1e", "fg": "#ffffff"}
-
         # Status label
-        self.status_label = tk.Label(
-            self.window, text="🎬 Processing Video...", font=("Arial", 12), **style
+        self.status_label = ttk.Label(
+            self.window,
+            text="🎬 Processing Video...",
+            font=("Arial", 12),
+            style=DARK_LABEL_STYLE,
         )
         self.status_label.pack(pady=10)
 
@@ -152,14 +224,17 @@ class ProcessingProgressWindow:
         self.progress_bar.pack(pady=10)
 
         # Progress percentage label
-        self.percentage_label = tk.Label(
-            self.window, text="0%", font=("Arial", 10), **style
+        self.percentage_label = ttk.Label(
+            self.window, text="0%", font=("Arial", 10), style=DARK_LABEL_STYLE
         )
         self.percentage_label.pack(pady=5)
 
         # Progress info
-        self.info_label = tk.Label(
-            self.window, text="Merging audio and video...", font=("Arial", 9), **style
+        self.info_label = ttk.Label(
+            self.window,
+            text="Merging audio and video...",
+            font=("Arial", 9),
+            style=DARK_LABEL_STYLE,
         )
         self.info_label.pack(pady=5)
 
@@ -190,13 +265,16 @@ class SettingsWindow:
         self.window.configure(bg="#1e1e1e")
         self.window.resizable(False, False)
 
-        # Make modal
-        self.window.transient(parent)
-        self.window.grab_set()
-
+        _ensure_dark_styles(self.window)
         self._setup_ui()
         self._load_current_settings()
 
+        # Make modal; a grab on a window that isn't viewable yet fails
+        self.window.transient(parent)
+        self.window.focus_set()
+        self.window.wait_visibility()
+        self.window.grab_set()
+
     def _setup_ui(self):
         """Set up the settings window UI."""
         # Create notebook for tabs
@@ -204,141 +282,152 @@ class SettingsWindow:
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Video settings tab
-        self.video_frame = tk.Frame(self.notebook, bg="#1e1e1e")
+        self.video_frame = ttk.Frame(self.notebook, style=DARK_FRAME_STYLE)
         self.notebook.add(self.video_frame, text="Video")
         self._setup_video_tab()
 
         # Audio settings tab
-        self.audio_frame = tk.Frame(self.notebook, bg="#1e1e1e")
+        self.audio_frame = ttk.Frame(self.notebook, style=DARK_FRAME_STYLE)
         self.notebook.add(self.audio_frame, text="Audio")
-        self._setup_audio_tab()
 
         # General settings tab
-        self.general_frame = tk.Frame(self.notebook, bg="#1e1e1e")
+        self.general_frame = ttk.Frame(self.notebook, style=DARK_FRAME_STYLE)
         self.notebook.add(self.general_frame, text="General")
-        self._setup_general_tab()
 
         # Buttons
         self._setup_buttons()
 
-    def _setup_video_tab(self):
-        """Set up video settings tab."""
-        style = {"bg": "#1e1e1e", "fg": "#ffffff"}
-        entry_style = {"bg": "#2e2e2e", "fg": "#ffffff", "insertbackground": "white"}
+        # Only the Video tab is visible on open, so the window can appear
+        # before the other two are filled in
+        self._deferred_tabs_built = False
+        self.window.after_idle(self._build_deferred_tabs)
 
-        row = 0
+    def _build_deferred_tabs(self):
+        """Fill in the Audio and General tabs, once."""
+        if self._deferred_tabs_built or not self.window.winfo_exists():
+            return
+        self._deferred_tabs_built = True
+        self._setup_audio_tab()
+        self._setup_general_tab()
+        self._load_current_settings()
 
-        # Codec selection
-        tk.Label(self.video_frame, text="Video Codec:", **style).grid(
+    def _labeled_row(self, frame, row: int, text: str, make_widget):
+        """Add a label in column 0 and the widget made for ``frame`` in column 1."""
+        ttk.Label(frame, text=text, style=DARK_LABEL_STYLE).grid(
             row=row, column=0, sticky="w", padx=5, pady=5
         )
+        widget = make_widget(frame)
+        widget.grid(row=row, column=1, sticky="w", padx=5, pady=5)
+        return widget
+
+    def _labeled_combo(self, frame, row: int, text: str, variable, values):
+        """Add a labeled read-only combobox row."""
+        return self._labeled_row(
+            frame,
+            row,
+            text,
+            lambda f: ttk.Combobox(
+                f, textvariable=variable, values=values, state="readonly"
+            ),
+        )
+
+    def _setup_video_tab(self):
+        """Set up video settings tab."""
+        frame = self.video_frame
+
+        # Codec selection
         self.codec_var = tk.StringVar()
-        codec_combo = ttk.Combobox(
-            self.video_frame, textvariable=self.codec_var, state="readonly"
+        self._labeled_combo(
+            frame,
+            0,
+            "Video Codec:",
+            self.codec_var,
+            list(self.config_manager.get_video_codecs().keys()),
         )
-        codec_combo["values"] = list(self.config_manager.get_video_codecs().keys())
-        codec_combo.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        row += 1
 
         # Quality setting
-        tk.Label(self.video_frame, text="Quality (1-100):", **style).grid(
-            row=row, column=0, sticky="w", padx=5, pady=5
-        )
         self.quality_var = tk.StringVar()
-        tk.Entry(self.video_frame, textvariable=self.quality_var, **entry_style).grid(
-            row=row, column=1, sticky="w", padx=5, pady=5
+        self._labeled_row(
+            frame,
+            1,
+            "Quality (1-100):",
+            lambda f: tk.Entry(f, textvariable=self.quality_var, **ENTRY_STYLE),
         )
-        row += 1
 
         # Output format
-        tk.Label(self.video_frame, text="Output Format:", **style).grid(
-            row=row, column=0, sticky="w", padx=5, pady=5
-        )
         self.format_var = tk.StringVar()
-        format_combo = ttk.Combobox(
-            self.video_frame, textvariable=self.format_var, state="readonly"
+        self._labeled_combo(
+            frame,
+            2,
+            "Output Format:",
+            self.format_var,
+            self.config_manager.get_output_formats(),
         )
-        format_combo["values"] = self.config_manager.get_output_formats()
-        format_combo.grid(row=row, column=1, sticky="w", padx=5, pady=5)
 
     def _setup_audio_tab(self):
         """Set up audio settings tab."""
-        style = {"bg": "#1e1e1e", "fg": "#ffffff"}
-        entry_style = {"bg": "#2e2e2e", "fg": "#ffffff", "insertbackground": "white"}
-
-        row = 0
+        frame = self.audio_frame
 
         # Sample rate
-        tk.Label(self.audio_frame, text="Sample Rate:", **style).grid(
-            row=row, column=0, sticky="w", padx=5, pady=5
-        )
         self.sample_rate_var = tk.StringVar()
-        rate_combo = ttk.Combobox(
-            self.audio_frame, textvariable=self.sample_rate_var, state="readonly"
+        self._labeled_combo(
+            frame,
+            0,
+            "Sample Rate:",
+            self.sample_rate_var,
+            ["22050", "44100", "48000", "96000"],
         )
-        rate_combo["values"] = ["22050", "44100", "48000", "96000"]
-        rate_combo.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        row += 1
 
         # Channels
-        tk.Label(self.audio_frame, text="Channels:", **style).grid(
-            row=row, column=0, sticky="w", padx=5, pady=5
-        )
         self.channels_var = tk.StringVar()
-        channels_combo = ttk.Combobox(
-            self.audio_frame, textvariable=self.channels_var, state="readonly"
+        self._labeled_combo(
+            frame, 1, "Channels:", self.channels_var, ["1 (Mono)", "2 (Stereo)"]
         )
-        channels_combo["values"] = ["1 (Mono)", "2 (Stereo)"]
-        channels_combo.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        row += 1
 
         # Bitrate
-        tk.Label(self.audio_frame, text="Bitrate:", **style).grid(
-            row=row, column=0, sticky="w", padx=5, pady=5
-        )
         self.bitrate_var = tk.StringVar()
-        bitrate_combo = ttk.Combobox(
-            self.audio_frame, textvariable=self.bitrate_var, state="readonly"
+        self._labeled_combo(
+            frame,
+            2,
+            "Bitrate:",
+            self.bitrate_var,
+            ["64k", "128k", "192k", "256k", "320k"],
         )
-        bitrate_combo["values"] = ["64k", "128k", "192k", "256k", "320k"]
-        bitrate_combo.grid(row=row, column=1, sticky="w", padx=5, pady=5)
-        row += 1
 
         # Audio delay compensation
-        tk.Label(self.audio_frame, text="Audio Delay (ms):", **style).grid(
-            row=row, column=0, sticky="w", padx=5, pady=5
-        )
         self.audio_delay_var = tk.StringVar()
-        delay_frame = tk.Frame(self.audio_frame, bg="#1e1e1e")
-        delay_frame.grid(row=row, column=1, sticky="w", padx=5, pady=5)
+        delay_frame = self._labeled_row(
+            frame,
+            3,
+            "Audio Delay (ms):",
+            lambda f: ttk.Frame(f, style=DARK_FRAME_STYLE),
+        )
 
         tk.Entry(
-            delay_frame, textvariable=self.audio_delay_var, width=10, **entry_style
+            delay_frame, textvariable=self.audio_delay_var, width=10, **ENTRY_STYLE
         ).pack(side=tk.LEFT)
-        tk.Label(
+        ttk.Label(
             delay_frame,
             text="(+delay audio, -advance audio)",
             font=("Arial", 8),
-            **style,
+            style=DARK_LABEL_STYLE,
         ).pack(side=tk.LEFT, padx=(5, 0))
 
     def _setup_general_tab(self):
         """Set up general settings tab."""
-        style = {"bg": "#1e1e1e", "fg": "#ffffff"}
-        entry_style = {"bg": "#2e2e2e", "fg": "#ffffff", "insertbackground": "white"}
-
-        row = 0
+        frame = self.general_frame
 
         # Output directory
-        tk.Label(self.general_frame, text="Output Directory:", **style).grid(
-            row=row, column=0, sticky="w", padx=5, pady=5
-        )
         self.output_dir_var = tk.StringVar()
-        dir_frame = tk.Frame(self.general_frame, bg="#1e1e1e")
-        dir_frame.grid(row=row, column=1, sticky="w", padx=5, pady=5)
+        dir_frame = self._labeled_row(
+            frame,
+            0,
+            "Output Directory:",
+            lambda f: ttk.Frame(f, style=DARK_FRAME_STYLE),
+        )
 
         tk.Entry(
-            dir_frame, textvariable=self.output_dir_var, width=30, **entry_style
+            dir_frame, textvariable=self.output_dir_var, width=30, **ENTRY_STYLE
         ).pack(side=tk.LEFT)
         tk.Button(
             dir_frame,
@@ -347,30 +436,28 @@ class SettingsWindow:
             bg="#3a3a3a",
             fg="white",
         ).pack(side=tk.LEFT, padx=(5, 0))
-        row += 1
 
         # Debug mode
         self.debug_var = tk.BooleanVar()
         tk.Checkbutton(
-            self.general_frame, text="Debug Mode", variable=self.debug_var, **style
-        ).grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
-        row += 1
+            frame, text="Debug Mode", variable=self.debug_var, **LABEL_STYLE
+        ).grid(row=1, column=0, columnspan=2, sticky="w", padx=5, pady=5)
 
         # Auto increment filename
         self.auto_increment_var = tk.BooleanVar()
         tk.Checkbutton(
-            self.general_frame,
+            frame,
             text="Auto-increment filenames",
             variable=self.auto_increment_var,
-            **style,
-        ).grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=5)
+            **LABEL_STYLE,
+        ).grid(row=2, column=0, columnspan=2, sticky="w", padx=5, pady=5)
 
     def _setup_buttons(self):
         """Set up OK/Cancel buttons."""
-        button_frame = tk.Frame(self.window, bg="#1e1e1e")
+        button_frame = ttk.Frame(self.window, style=DARK_FRAME_STYLE)
         button_frame.pack(pady=10)
 
-        btn_style = {"bg": "#3a3a3a", "fg": "white", "activebackground": "#5a5a5a"}
+        btn_style = BUTTON_STYLE
 
         tk.Button(
             button_frame, text="OK", command=self._save_settings, **btn_style
@@ -390,6 +477,8 @@ class SettingsWindow:
         self.codec_var.set(self.config.video_codec)
         self.quality_var.set(str(self.config.video_quality))
         self.format_var.set(self.config.output_format)
+        if not self._deferred_tabs_built:
+            return
         self.sample_rate_var.set(str(self.config.audio_sample_rate))
         self.channels_var.set(
             f"{self.config.audio_channels} ({'Mono' if self.config.audio_channels == 1 else 'Stereo'})"
@@ -408,6 +497,7 @@ class SettingsWindow:
 
     def _save_settings(self):
         """Save settings and close window."""
+        self._build_deferred_tabs()
         try:
             # Update config
             self.config.video_codec = self.codec_var.get()
@@ -456,6 +546,7 @@ class RecorderApp:
         self.root = root
         self.root.title("Advanced Screen + Audio Recorder")
         self.root.configure(bg="#1e1e1e")
+        _ensure_dark_styles(self.root)
 
         # Initialize components
         self.config_manager = ConfigManager()
@@ -480,17 +571,22 @@ class RecorderApp:
         self.final_file: str | None = None
         self.last_saved_recording: str | None = None
         self.recording_timer = RecordingTimer()
+        # Switches pause state off the Tk thread, since audio segments are slow
+        self._pause_thread: threading.Thread | None = None
 
         # UI components
         self.progress_window: ProgressWindow | None = None
         self.processing_window: ProcessingProgressWindow | None = None
+        self._settings_window: SettingsWindow | None = None
         self.app_checkboxes: dict[str, tk.BooleanVar] = {}
+        self._available_apps = self.config_manager.get_available_apps()
         self.log_text = tk.StringVar(value="Ready")
+        self._pending_log: str | None = None
+        self._log_flush_scheduled = False
 
         # Available screens
         try:
-            temp_recorder = ScreenRecorder(1)
-            self.screens = temp_recorder.detect_screens()
+            self.screens = ScreenRecorder.enumerate_monitors()
         except VideoCaptureError as e:
             self.logger.error(f"Failed to detect screens: {e}")
             self.screens = []
@@ -530,35 +626,40 @@ class RecorderApp:
         self.root.grid_columnconfigure(0, weight=1)
 
         # Main frame
-        main_frame = tk.Frame(self.root, bg="#1e1e1e")
+        main_frame = ttk.Frame(self.root, style=DARK_FRAME_STYLE)
         main_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
 
         # Styles
-        label_style = {"bg": "#1e1e1e", "fg": "#ffffff"}
-        entry_style = {"bg": "#2e2e2e", "fg": "#ffffff", "insertbackground": "white"}
-        btn_style = {"bg": "#3a3a3a", "fg": "white", "activebackground": "#5a5a5a"}
+        entry_style = ENTRY_STYLE
+        btn_style = BUTTON_STYLE
 
         row = 0
 
         # FPS setting
-        tk.Label(main_frame, text="FPS:", **label_style).grid(
+        ttk.Label(main_frame, text="FPS:", style=DARK_LABEL_STYLE).grid(
             row=row, column=0, sticky="w", pady=5
         )
         self.fps_entry = tk.Entry(main_frame, width=10, **entry_style)
         self.fps_entry.insert(0, str(self.config.fps))
+        # Reject keystrokes that can't lead to a valid FPS, so the entry
+        # never holds text rather than a number
+        self.fps_entry.config(
+            validate="key",
+            validatecommand=(self.root.register(self._validate_fps_entry), "%P"),
+        )
         self.fps_entry.grid(row=row, column=1, sticky="w", pady=5)
         row += 1
 
         # Screen selector
         if self.screens:
-            tk.Label(main_frame, text="Screen:", **label_style).grid(
+            ttk.Label(main_frame, text="Screen:", style=DARK_LABEL_STYLE).grid(
                 row=row, column=0, sticky="w", pady=5
             )
-            screen_options = [
+            self._screen_options = tuple(
                 f"{s['name']}: {s['width']}x{s['height']}" for s in self.screens
-            ]
+            )
             self.screen_combo = ttk.Combobox(
-                main_frame, values=screen_options, state="readonly", width=30
+                main_frame, values=self._screen_options, state="readonly", width=30
             )
             if self.config.default_monitor <= len(self.screens):
                 self.screen_combo.current(self.config.default_monitor - 1)
@@ -569,14 +670,14 @@ class RecorderApp:
             row += 1
 
         # Audio apps section with hide/show button
-        audio_header_frame = tk.Frame(main_frame, bg="#1e1e1e")
+        audio_header_frame = ttk.Frame(main_frame, style=DARK_FRAME_STYLE)
         audio_header_frame.grid(
             row=row, column=0, columnspan=3, sticky="w", pady=(15, 5)
         )
 
-        tk.Label(audio_header_frame, text="Audio Sources:", **label_style).pack(
-            side=tk.LEFT
-        )
+        ttk.Label(
+            audio_header_frame, text="Audio Sources:", style=DARK_LABEL_STYLE
+        ).pack(side=tk.LEFT)
 
         # Hide/Show sources button
         self.sources_visible = tk.BooleanVar(value=False)
@@ -591,37 +692,29 @@ class RecorderApp:
         row += 1
 
         # Audio apps checkboxes
-        self.apps_frame = tk.Frame(main_frame, bg="#1e1e1e")
+        self.apps_frame = ttk.Frame(main_frame, style=DARK_FRAME_STYLE)
         self.apps_frame.grid(row=row, column=0, columnspan=3, sticky="w", pady=5)
 
-        available_apps = self.config_manager.get_available_apps()
-        for idx, app in enumerate(available_apps):
-            var = tk.BooleanVar(value=app in self.config.selected_apps)
-            chk = tk.Checkbutton(
-                self.apps_frame,
-                text=app,
-                variable=var,
-                bg="#1e1e1e",
-                fg="#cccccc",
-                selectcolor="#2e2e2e",
-                activebackground="#333333",
+        # The selection is tracked from the start, but the checkboxes that
+        # show it are only built the first time the sources are shown
+        for app in self._available_apps:
+            self.app_checkboxes[app] = tk.BooleanVar(
+                value=app in self.config.selected_apps
             )
-            chk.grid(row=idx // 3, column=idx % 3, sticky="w", padx=5)
-            self.app_checkboxes[app] = var
 
         # Hide sources by default
         self.apps_frame.grid_remove()
         row += 1
 
         # Status and progress
-        self.status_label = tk.Label(
-            main_frame, textvariable=self.log_text, **label_style
+        self.status_label = ttk.Label(
+            main_frame, textvariable=self.log_text, style=DARK_LABEL_STYLE
         )
         self.status_label.grid(row=row, column=0, columnspan=3, sticky="w", pady=15)
         row += 1
 
         # Control buttons
-        buttons_frame = tk.Frame(main_frame, bg="#1e1e1e")
+        buttons_frame = ttk.Frame(main_frame, style=DARK_FRAME_STYLE)
         buttons_frame.grid(row=row, column=0, columnspan=3, pady=10)
 
         self.start_btn = tk.Button(
@@ -675,17 +768,11 @@ class RecorderApp:
 
         row += 1
 
-        # Progress bar (initially hidden)
-        self.progress_var = tk.DoubleVar()
-        self.progress_bar = ttk.Progressbar(
-            main_frame, variable=self.progress_var, mode="indeterminate"
-        )
-
         # Keyboard shortcuts help
         help_text = "Shortcuts: F1=Start/Stop, F2=Pause, F3=Settings, F4=Open Recording, F5=Cancel, Esc=Stop"
-        tk.Label(main_frame, text=help_text, **label_style, font=("Arial", 8)).grid(
-            row=row, column=0, columnspan=3, sticky="w", pady=(20, 0)
-        )
+        ttk.Label(
+            main_frame, text=help_text, style=DARK_LABEL_STYLE, font=("Arial", 8)
+        ).grid(row=row, column=0, columnspan=3, sticky="w", pady=(20, 0))
 
     def _setup_keyboard_shortcuts(self):
         """Set up keyboard shortcuts."""
@@ -704,22 +791,79 @@ class RecorderApp:
         if hasattr(self, "screen_combo"):
             self.selected_screen_index.set(self.screen_combo.current() + 1)
 
+    def _validate_fps_entry(self, new: str) -> bool:
+        """Accept an edit only if it keeps the FPS entry a number up to 120."""
+        if FPS_INPUT_RE.fullmatch(new) is None:
+            return False
+        return new in ("", ".") or float(new) <= 120
+
+    def _build_app_checkboxes(self):
+        """Create a checkbox for each audio source, laid out in three columns."""
+        for idx, (app, var) in enumerate(self.app_checkboxes.items()):
+            chk = tk.Checkbutton(
+                self.apps_frame,
+                text=app,
+                variable=var,
+                bg="#1e1e1e",
+                fg="#cccccc",
+                selectcolor="#2e2e2e",
+                activebackground="#333333",
+            )
+            chk.grid(row=idx // 3, column=idx % 3, sticky="w", padx=5)
+
+    def refresh_apps(self):
+        """Re-read the available audio sources and rebuild their checkboxes."""
+        self._available_apps = self.config_manager.get_available_apps()
+        selected = {app for app, var in self.app_checkboxes.items() if var.get()}
+        self.app_checkboxes = {
+            app: tk.BooleanVar(value=app in selected) for app in self._available_apps
+        }
+
+        for child in self.apps_frame.winfo_children():
+            child.destroy()
+        if self.sources_visible.get():
+            self._build_app_checkboxes()
+
     def _toggle_sources_visibility(self):
         """Toggle the visibility of audio sources checkboxes."""
         if self.sources_visible.get():
             # Hide sources
-            self.apps_frame.grid_remove()
             self.sources_visible.set(False)
             self.toggle_sources_btn.config(text="Show Sources")
+            self.apps_frame.grid_remove()
         else:
             # Show sources
-            self.apps_frame.grid()
+            if not self.apps_frame.winfo_children():
+                self._build_app_checkboxes()
             self.sources_visible.set(True)
             self.toggle_sources_btn.config(text="Hide Sources")
+            self.apps_frame.grid()
+
+        # Lay out the button and the frame change together, in one pass
+        self.apps_frame.update_idletasks()
 
     def _log(self, msg: str):
         """Update log display."""
         self.logger.info(msg)
+
+        # Worker threads never touch the widgets; the Tk loop shows it
+        if threading.current_thread() is not threading.main_thread():
+            self.root.after(0, self._show_log, msg)
+        else:
+            self._show_log(msg)
+
+    def _show_log(self, msg: str):
+        """Queue a message for display, on the Tk thread."""
+        # A burst of messages collapses into one redraw of the latest
+        self._pending_log = msg
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """Show the most recent log message."""
+        self._log_flush_scheduled = False
+        msg = self._pending_log
         self.log_text.set(msg)
 
         # Update progress window if open
@@ -735,38 +879,93 @@ class RecorderApp:
 
     def pause_recording(self):
         """Pause/resume recording."""
-        if self.recorder and self.recorder.recording:
-            self.recorder.pause_recording()
+        if not self.recorder or not self.recorder.recording:
+            return
+        # Ignore clicks until the previous switch has finished
+        if self._pause_thread and self._pause_thread.is_alive():
+            return
+
+        self.pause_btn.config(state=tk.DISABLED)
+        if self.progress_window:
+            self.progress_window.pause_btn.config(state=tk.DISABLED)
 
-            # Pause/resume audio recording as well
-            if self.audio_capture:
+        self._pause_thread = threading.Thread(target=self._toggle_pause, daemon=True)
+        self._pause_thread.start()
+
+    def _toggle_pause(self):
+        """Switch video and audio between paused and recording, off the Tk thread.
+
+        Ending an audio segment can take seconds and starting one waits for
+        ffmpeg to open the sound server. Video pauses before its audio
+        segment ends and resumes only once the next one is capturing, so
+        neither stream records while the other does not.
+        """
+        try:
+            pausing = not self.recorder.paused
+            # Muxed audio pauses with the video
+            audio_capture = (
+                self.audio_capture
+                if self.audio_capture and self.audio_capture.recording_process
+                else None
+            )
+
+            if pausing:
+                self.recorder.pause_recording()
+                self.recording_timer.pause()
+
+            if audio_capture:
                 try:
-                    self.audio_capture.pause_recording()
+                    audio_capture.pause_recording()
                 except AudioCaptureError as e:
                     self.logger.warning(f"Audio pause/resume failed: {e}")
 
-            # Update UI
-            if self.recorder.paused:
-                self.pause_btn.config(text="▶️ Resume")
-                self._log("Recording paused")
-            else:
-                self.pause_btn.config(text="⏸️ Pause")
-                self._log("Recording resumed")
+            if not pausing:
+                self.recorder.pause_recording()
+                self.recording_timer.resume()
+
+        except VideoCaptureError as e:
+            self.logger.warning(f"Pause/resume failed: {e}")
+        finally:
+            self.root.after(0, self._show_pause_state)
 
-            if self.progress_window:
-                self.progress_window.set_paused(self.recorder.paused)
+    def _show_pause_state(self):
+        """Update the UI once a pause switch has finished, on the Tk thread."""
+        # A stop or cancel meanwhile has already reset the buttons
+        if not self.recorder or not self.recorder.recording:
+            return
+
+        paused = self.recorder.paused
+        if paused:
+            self.pause_btn.config(state=tk.NORMAL, text="▶️ Resume")
+            self._log("Recording paused")
+        else:
+            self.pause_btn.config(state=tk.NORMAL, text="⏸️ Pause")
+            self._log("Recording resumed")
+
+        if self.progress_window:
+            self.progress_window.pause_btn.config(state=tk.NORMAL)
+            self.progress_window.set_paused(paused)
+
+    def _wait_for_pause_switch(self):
+        """Let a pause switch still running finish before stopping."""
+        if self._pause_thread:
+            self._pause_thread.join()
+            self._pause_thread = None
 
     def start_recording(self):
         """Start recording with enhanced error handling."""
         try:
             self._log("=== START RECORDING CALLED ===")
 
-            # Check if already recording
-            if self.recorder and self.recorder.recording:
+            # Check if already recording, or still starting or stopping
+            if (self.recorder and self.recorder.recording) or self.start_btn.cget(
+                "state"
+            ) == tk.DISABLED:
                 self._log("Already recording - ignoring start request")
                 return
 
-            # Validate FPS
+            # Validate FPS; typing already keeps it numeric and at most 120,
+            # which leaves an empty or zero entry to catch here
             valid, fps = validate_fps(self.fps_entry.get())
             if not valid:
                 messagebox.showerror(
@@ -778,12 +977,13 @@ class RecorderApp:
             selected_apps = [
                 app for app, var in self.app_checkboxes.items() if var.get()
             ]
-            if not selected_apps:
-                if not messagebox.askyesno(
-                    "No Audio Sources",
-                    "No audio sources selected. Continue with video only?",
-                ):
-                    return
+            record_audio = bool(selected_apps)
+            if not record_audio and not messagebox.askyesno(
+                "No Audio Sources",
+                "No audio sources selected. Continue with video only?",
+                parent=self.root,
+            ):
+                return
 
             # Initialize recorder
             self.recorder = ScreenRecorder(
@@ -793,9 +993,10 @@ class RecorderApp:
                 quality=self.config.video_quality,
                 log_callback=self._log,
             )
+            self.recorder.prewarm_encoder()
 
             # Initialize audio capture if apps selected
-            if selected_apps:
+            if record_audio:
                 self.audio_capture = SystemAudioCapture(
                     selected_apps,
                     sample_rate=self.config.audio_sample_rate,
@@ -804,23 +1005,34 @@ class RecorderApp:
                 )
 
                 if not self.audio_capture.setup():
-                    messagebox.showerror(
-                        "Audio Setup Failed",
-                        "Failed to set up audio capture. Continue with video only?",
-                    )
+                    self.audio_capture = None
                     if not messagebox.askyesno(
-                        "Continue?", "Record video without audio?"
+                        "Audio Setup Failed",
+                        "Failed to set up audio capture. Record video without audio?",
+                        icon=messagebox.WARNING,
+                        parent=self.root,
                     ):
                         return
-                    self.audio_capture = None
+
+            # Record audio inside the video encoder when it can mux it, which
+            # leaves nothing to merge once recording stops
+            audio_muxed = bool(self.audio_capture) and self.recorder.attach_audio(
+                "record_sink.monitor",
+                self.config.output_format,
+                sample_rate=self.config.audio_sample_rate,
+                channels=self.config.audio_channels,
+                bitrate=self.config.audio_bitrate,
+                delay_ms=self.config.audio_delay_ms,
+            )
+            temp_suffix = (
+                f"_temp.{self.config.output_format}" if audio_muxed else "_temp.avi"
+            )
 
             # Generate output filename
             if self.config.auto_increment_filename:
                 base_name = Path(self.config.output_directory) / "recording"
-                temp_video = f"{base_name}_temp.avi"
+                temp_video = f"{base_name}{temp_suffix}"
                 # Generate unique audio filename for each recording
-                import time
-
                 self.audio_file = f"temp_audio_{int(time.time())}.wav"
             else:
                 temp_video = filedialog.asksaveasfilename(
@@ -835,21 +1047,35 @@ class RecorderApp:
                 if not temp_video:
                     return
                 temp_video = temp_video.replace(
-                    f".{self.config.output_format}", "_temp.avi"
+                    f".{self.config.output_format}", temp_suffix
                 )
                 # Generate unique audio filename for each recording
-                import time
-
                 self.audio_file = f"temp_audio_{int(time.time())}.wav"
 
+            if audio_muxed:
+                self.audio_file = None
+
             # Start audio recording first (it takes longer to initialize)
-            if self.audio_capture:
+            if self.audio_capture and not audio_muxed:
                 self.audio_proc = self.audio_capture.start_recording(self.audio_file)
-                # Small delay to let audio recording stabilize
-                import time
+                # Let audio recording stabilize, without blocking the Tk loop
+                self.start_btn.config(state=tk.DISABLED)
+                self.root.after(100, self._start_video_phase, temp_video)
+                return
 
-                time.sleep(0.1)
+            self._start_video_phase(temp_video)
+
+        except (VideoCaptureError, AudioCaptureError) as e:
+            messagebox.showerror("Recording Error", str(e))
+            self._cleanup_recording()
+        except Exception as e:
+            self.logger.error(f"Unexpected error starting recording: {e}")
+            messagebox.showerror("Error", f"Failed to start recording: {e}")
+            self._cleanup_recording()
 
+    def _start_video_phase(self, temp_video: str):
+        """Start video recording and switch the UI to the recording state."""
+        try:
             # Start video recording
             self.video_file = self.recorder.start_recording(temp_video)
 
@@ -858,8 +1084,6 @@ class RecorderApp:
             self.pause_btn.config(state=tk.NORMAL, text="⏸️ Pause")
             self.stop_btn.config(state=tk.NORMAL)
             self.cancel_btn.config(state=tk.NORMAL)
-            self.progress_bar.grid(row=100, column=0, columnspan=3, sticky="ew", pady=5)
-            self.progress_bar.start()
 
             # Start timer and show progress window
             self.recording_timer.start()
@@ -868,7 +1092,9 @@ class RecorderApp:
             self.progress_window.stop_btn.config(command=self.stop_recording)
             self.progress_window.cancel_btn.config(command=self.cancel_recording)
 
-            self._log("Recording started...")
+            # A static status line; an animated bar would redraw the main
+            # window for the whole recording
+            self._log("🔴 Recording in progress")
 
         except (VideoCaptureError, AudioCaptureError) as e:
             messagebox.showerror("Recording Error", str(e))
@@ -889,12 +1115,12 @@ class RecorderApp:
         self.start_btn.config(state=tk.DISABLED)
         self.stop_btn.config(state=tk.DISABLED, text="Stopping...")
         self.cancel_btn.config(state=tk.DISABLED)
-        self.root.update_idletasks()
 
         def _stop_recording_thread():
             """Handle the actual stopping in a separate thread to keep UI responsive."""
             try:
                 self._log("=== UI STOP RECORDING THREAD STARTED ===")
+                self._wait_for_pause_switch()
                 # Stop timer first
                 self.recording_timer.stop()
                 self._log("Recording timer stopped")
@@ -908,12 +1134,6 @@ class RecorderApp:
                 else:
                     self._log("No recorder object found")
 
-                # Give the video writer a moment to finalize the file
-                import time
-
-                self._log("Waiting 1 second for video file finalization...")
-                time.sleep(1.0)
-
                 # Stop audio recording
                 self._log("Stopping audio recording...")
                 if self.audio_capture:
@@ -932,16 +1152,16 @@ class RecorderApp:
 
                 # Verify files exist before processing
                 self._log("=== FILE VERIFICATION ===")
-                if video_output and Path(video_output).exists():
-                    video_size = Path(video_output).stat().st_size
+                video_size = get_file_size(video_output)
+                if video_size:
                     self._log(
                         f"✓ Video file exists: {video_output} ({video_size} bytes)"
                     )
                 else:
                     self._log(f"✗ Video file missing or empty: {video_output}")
 
-                if self.audio_file and Path(self.audio_file).exists():
-                    audio_size = Path(self.audio_file).stat().st_size
+                audio_size = get_file_size(self.audio_file)
+                if audio_size:
                     self._log(
                         f"✓ Audio file exists: {self.audio_file} ({audio_size} bytes)"
                     )
@@ -950,7 +1170,7 @@ class RecorderApp:
 
                 # Process output only if we have valid video
                 self._log("=== PROCESSING OUTPUT ===")
-                if video_output and Path(video_output).exists():
+                if video_output and os.access(video_output, os.F_OK):
                     self._log("Starting output processing...")
                     final_output = self._process_output(video_output)
                     if final_output:
@@ -977,8 +1197,6 @@ class RecorderApp:
             except Exception as e:
                 error_msg = f"Error stopping recording: {e}"
                 self.logger.error(error_msg)
-                import traceback
-
                 self.logger.error(f"Stop recording traceback: {traceback.format_exc()}")
                 self.root.after(
                     0,
@@ -988,11 +1206,10 @@ class RecorderApp:
                 # Always schedule UI cleanup on main thread, regardless of success or failure
                 self.root.after(0, self._cleanup_recording)
 
-        # Start the stopping process in a separate thread
-        import threading
-
+        # Start the stopping process in a separate thread, once the Tk loop
+        # has redrawn the buttons above
         stop_thread = threading.Thread(target=_stop_recording_thread, daemon=True)
-        stop_thread.start()
+        self.root.after_idle(stop_thread.start)
 
         # Add a backup cleanup after a reasonable timeout (30 seconds)
         # This ensures buttons are re-enabled even if something goes wrong
@@ -1023,6 +1240,7 @@ class RecorderApp:
             """Handle the actual cancellation in a separate thread to keep UI responsive."""
             try:
                 # Stop recording
+                self._wait_for_pause_switch()
                 self.recording_timer.stop()
                 self.recorder.stop_recording()
 
@@ -1037,14 +1255,12 @@ class RecorderApp:
 
                 # Clean up temp files without processing/saving
                 temp_files = []
-                if self.video_file and Path(self.video_file).exists():
+                if self.video_file and os.access(self.video_file, os.F_OK):
                     temp_files.append(self.video_file)
-                if self.audio_file and Path(self.audio_file).exists():
+                if self.audio_file and os.access(self.audio_file, os.F_OK):
                     temp_files.append(self.audio_file)
 
                 if temp_files:
-                    from video import cleanup_temp_files
-
                     cleanup_temp_files(temp_files, self._log)
 
                 def _update_ui_with_cancel():
@@ -1064,8 +1280,6 @@ class RecorderApp:
                 self.root.after(0, self._cleanup_recording)
 
         # Start the cancellation process in a separate thread
-        import threading
-
         cancel_thread = threading.Thread(target=_cancel_recording_thread, daemon=True)
         cancel_thread.start()
 
@@ -1083,14 +1297,15 @@ class RecorderApp:
 
     def _process_output(self, video_file: str) -> str | None:
         """Process the recorded output (merge audio/video, cleanup)."""
-        # Show processing progress window
-        self.processing_window = ProcessingProgressWindow(self.root)
+        # Runs on the stop thread, so the processing window is opened,
+        # updated and closed from the Tk loop, in that order
+        self.root.after(0, self._open_processing_window)
 
         def progress_callback(percentage: float, info: str):
             """Update processing progress."""
-            if self.processing_window:
-                self.processing_window.update_progress(percentage, info)
+            self.root.after(0, self._update_processing_window, percentage, info)
 
+        video_path = Path(video_file)
         try:
             if self.config.auto_increment_filename:
                 final_output = get_incremental_filename(
@@ -1098,29 +1313,24 @@ class RecorderApp:
                     extension=f".{self.config.output_format}",
                 )
             else:
-                final_output = video_file.replace(
-                    "_temp.avi", f".{self.config.output_format}"
+                final_output = str(
+                    video_path.with_name(
+                        video_path.stem.removesuffix("_temp")
+                        + f".{self.config.output_format}"
+                    )
                 )
 
-            # Check file sizes before processing
-            video_size = (
-                Path(video_file).stat().st_size if Path(video_file).exists() else 0
-            )
-            audio_size = (
-                Path(self.audio_file).stat().st_size
-                if self.audio_file and Path(self.audio_file).exists()
-                else 0
-            )
+            # Check the files once before processing
+            video_st = stat_file(video_file)
+            audio_st = stat_file(self.audio_file)
+            video_size = video_st.st_size if video_st else 0
+            audio_size = audio_st.st_size if audio_st else 0
 
             self._log(f"Video file: {video_file} ({video_size} bytes)")
             self._log(f"Audio file: {self.audio_file} ({audio_size} bytes)")
 
             # Merge audio and video if both exist
-            if (
-                self.audio_file
-                and Path(self.audio_file).exists()
-                and Path(video_file).exists()
-            ):
+            if audio_st and video_st:
                 if video_size < 1000:  # Less than 1KB indicates a problem
                     self._log("WARNING: Video file is very small, may be corrupted")
 
@@ -1140,44 +1350,37 @@ class RecorderApp:
 
                 if success:
                     # Check final file size
-                    final_size = (
-                        Path(final_output).stat().st_size
-                        if Path(final_output).exists()
-                        else 0
-                    )
+                    final_size = get_file_size(final_output)
                     self._log(f"Final file: {final_output} ({final_size} bytes)")
 
-                    # Clean up temporary files
+                    # Unlinking a long recording can take a while, and the
+                    # saved file is ready for the user before that finishes
                     temp_files = [video_file]
                     if self.audio_file:
                         temp_files.append(self.audio_file)
-                    cleanup_temp_files(temp_files, self._log)
+                    schedule_cleanup(temp_files, self._log)
                     return final_output
                 else:
                     # Keep original video file if merge failed
                     self._log("Merge failed, keeping original video file")
-                    import shutil
-
-                    shutil.move(video_file, final_output)
+                    move_file(video_file, final_output)
                     return final_output
             else:
                 # Only video, rename to final output
                 missing_files = []
-                if not Path(video_file).exists():
+                if not video_st:
                     missing_files.append("video")
-                if not self.audio_file or not Path(self.audio_file).exists():
+                if not audio_st and self.audio_file:
                     missing_files.append("audio")
 
                 if missing_files:
                     self._log(f"Missing files: {', '.join(missing_files)}")
 
-                if Path(video_file).exists():
-                    import shutil
-
-                    shutil.move(video_file, final_output)
+                if video_st:
+                    move_file(video_file, final_output)
 
                     # Clean up audio temp file if it exists
-                    if self.audio_file and Path(self.audio_file).exists():
+                    if audio_st:
                         cleanup_temp_files([self.audio_file], self._log)
 
                     return final_output
@@ -1186,7 +1389,7 @@ class RecorderApp:
 
                     # Clean up temp files even if processing failed
                     temp_files = []
-                    if self.audio_file and Path(self.audio_file).exists():
+                    if audio_st:
                         temp_files.append(self.audio_file)
                     if temp_files:
                         cleanup_temp_files(temp_files, self._log)
@@ -1198,13 +1401,9 @@ class RecorderApp:
 
             # Clean up temp files even if processing failed
             temp_files = []
-            if (
-                hasattr(self, "audio_file")
-                and self.audio_file
-                and Path(self.audio_file).exists()
-            ):
+            if self.audio_file and os.access(self.audio_file, os.F_OK):
                 temp_files.append(self.audio_file)
-            if "video_file" in locals() and Path(video_file).exists():
+            if os.access(video_path, os.F_OK):
                 temp_files.append(video_file)
             if temp_files:
                 cleanup_temp_files(temp_files, self._log)
@@ -1212,9 +1411,22 @@ class RecorderApp:
             return None
         finally:
             # Close processing window
-            if self.processing_window:
-                self.processing_window.close()
-                self.processing_window = None
+            self.root.after(0, self._close_processing_window)
+
+    def _open_processing_window(self):
+        """Show the processing progress window."""
+        self.processing_window = ProcessingProgressWindow(self.root)
+
+    def _update_processing_window(self, percentage: float, info: str):
+        """Update processing progress, if the window is still open."""
+        if self.processing_window:
+            self.processing_window.update_progress(percentage, info)
+
+    def _close_processing_window(self):
+        """Close the processing progress window, if open."""
+        if self.processing_window:
+            self.processing_window.close()
+            self.processing_window = None
 
     def _cleanup_recording(self):
         """Clean up recording state."""
@@ -1232,8 +1444,6 @@ class RecorderApp:
         self.pause_btn.config(state=tk.DISABLED, text="⏸️ Pause")
         self.stop_btn.config(state=tk.DISABLED, text="⏹️ Stop Recording")
         self.cancel_btn.config(state=tk.DISABLED, text="❌ Cancel")
-        self.progress_bar.stop()
-        self.progress_bar.grid_remove()
 
         # Close progress window
         if self.progress_window:
@@ -1253,7 +1463,12 @@ class RecorderApp:
 
     def open_settings(self):
         """Open settings window."""
-        SettingsWindow(self.root, self.config_manager)
+        # Raise the open one rather than stacking a second modal on it
+        if self._settings_window and self._settings_window.window.winfo_exists():
+            self._settings_window.window.lift()
+            self._settings_window.window.focus_force()
+            return
+        self._settings_window = SettingsWindow(self.root, self.config_manager)
 
     def open_last_recording(self):
         """Open the last saved recording file."""
@@ -1262,12 +1477,11 @@ class RecorderApp:
             return
 
         self._log(f"Attempting to open file: {self.last_saved_recording}")
-        self._log(f"File exists: {Path(self.last_saved_recording).exists()}")
-        self._log(
-            f"File size: {Path(self.last_saved_recording).stat().st_size if Path(self.last_saved_recording).exists() else 'N/A'} bytes"
-        )
+        recording_st = stat_file(self.last_saved_recording)
+        self._log(f"File exists: {recording_st is not None}")
+        self._log(f"File size: {recording_st.st_size if recording_st else 'N/A'} bytes")
 
-        if not Path(self.last_saved_recording).exists():
+        if not recording_st:
             messagebox.showerror(
                 "File Not Found",
                 f"Recording file not found:\n{self.last_saved_recording}",
@@ -1276,9 +1490,6 @@ class RecorderApp:
 
         try:
             # Open the file with the default system application
-            import os
-            import platform
-
             system = platform.system()
             if system == "Windows":
                 os.startfile(self.last_saved_recording)
@@ -1342,8 +1553,6 @@ class RecorderApp:
                             env=clean_env,
                         )
                         # Give it a moment to start
-                        import time
-
                         time.sleep(1.0)
 
                         # Check if process is still running (didn't immediately fail)
@@ -1405,13 +1614,11 @@ class RecorderApp:
         """Handle application closing."""
         # Save window position if enabled
         if self.config.remember_window_position:
-            geometry = self.root.geometry()
-            # Parse geometry string (WxH+X+Y)
-            size_pos = geometry.split("+")
-            if len(size_pos) >= 3:
-                self.config.window_x = int(size_pos[1])
-                self.config.window_y = int(size_pos[2])
-                self.config_manager.save_config()
+            # Read the position directly; parsing the geometry string broke
+            # on negative offsets (WxH-X+Y) from monitors left of the primary
+            self.config.window_x = self.root.winfo_x()
+            self.config.window_y = self.root.winfo_y()
+            self.config_manager.save_config()
 
         # Stop recording if in progress
         if self.recorder and self.recorder.recording:
@@ -1,12 +1,23 @@
 """Utility functions and logging setup for the screen recorder."""
 
+import atexit
+import errno
+import functools
+import importlib.util
 import logging
+import logging.handlers
 import os
+import queue
+import re
+import shutil
 import sys
 import time
 from collections.abc import Callable
 from pathlib import Path
 
+# Writes log records to the real handlers off the logging threads
+_log_listener: logging.handlers.QueueListener | None = None
+
 
 def setup_logging(
     log_level: str = "INFO", debug_mode: bool = False, log_file: str | None = None
@@ -25,15 +36,34 @@ def setup_logging(
         log_format = "%(asctime)s - %(levelname)s - %(message)s"
 
     # Set up handlers
-    handlers = [logging.StreamHandler(sys.stdout)]
+    handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
     if log_file:
         handlers.append(logging.FileHandler(log_file))
+    formatter = logging.Formatter(log_format)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Loggers only enqueue records; the console and file writes happen on
+    # the listener's thread, so they never block recording or the UI
+    global _log_listener
+    if _log_listener:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+    else:
+        atexit.register(_stop_log_listener)
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+    _log_listener.start()
+
+    # The listener's handlers format records, so this one passes them as is
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter())
 
     # Configure root logger
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format=log_format,
-        handlers=handlers,
+        handlers=[queue_handler],
         force=True,
     )
 
@@ -43,6 +73,12 @@ def setup_logging(
     return logger
 
 
+def _stop_log_listener() -> None:
+    """Flush the queued log records at exit."""
+    if _log_listener:
+        _log_listener.stop()
+
+
 def get_incremental_filename(
     base_name: str = "output", extension: str = ".mp4", directory: str = ""
 ) -> str:
@@ -54,29 +90,37 @@ def get_incremental_filename(
     else:
         base_path = Path(base_name)
 
-    i = 1
-    while True:
-        filename = f"{base_path}_{i}{extension}"
-        if not Path(filename).exists():
-            return filename
-        i += 1
+    # One directory listing instead of a stat() per existing recording
+    parent = base_path.parent
+    pattern = re.compile(rf"{re.escape(base_path.name)}_(\d+){re.escape(extension)}")
+    try:
+        with os.scandir(parent) as entries:
+            used = [
+                int(match.group(1))
+                for entry in entries
+                if (match := pattern.fullmatch(entry.name))
+            ]
+    except FileNotFoundError:
+        used = []
+
+    return f"{base_path}_{max(used, default=0) + 1}{extension}"
 
 
 def format_time(seconds: float) -> str:
     """Format seconds into HH:MM:SS format."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
+FILE_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_file_size(bytes_size: int) -> str:
     """Format file size in human readable format."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} TB"
+    # Every 10 bits of the size is one step up in binary units
+    unit = min(max(0, (int(bytes_size).bit_length() - 1) // 10), 4)
+    return f"{bytes_size / (1 << (10 * unit)):.1f} {FILE_SIZE_UNITS[unit]}"
 
 
 def validate_fps(fps: str) -> tuple[bool, float]:
@@ -95,18 +139,48 @@ def validate_monitor_index(index: int, max_monitors: int) -> bool:
     return 1 <= index <= max_monitors
 
 
-def safe_remove_file(filepath: str, logger: logging.Logger | None = None) -> bool:
+def stat_file(filepath: str | None) -> os.stat_result | None:
+    """Stat a file, or return None if there is no such file."""
+    if not filepath:
+        return None
+    # One stat call, where an exists() check first would make two
+    try:
+        return os.stat(filepath)
+    except FileNotFoundError:
+        return None
+
+
+def get_file_size(filepath: str | None) -> int:
+    """Get a file's size in bytes, or 0 if there is no such file."""
+    st = stat_file(filepath)
+    return st.st_size if st else 0
+
+
+def move_file(src: str, dst: str) -> None:
+    """Move a file, by rename when both paths are on the same filesystem."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+def safe_remove_file(
+    filepath: str, logger: "logging.Logger | CallbackLogger | None" = None
+) -> bool:
     """Safely remove a file with error handling."""
+    # Unlink straight away; a missing file is already the wanted outcome
     try:
-        if os.path.exists(filepath):
-            os.remove(filepath)
-            if logger:
-                logger.debug(f"Removed file: {filepath}")
-            return True
+        os.unlink(filepath)
+    except FileNotFoundError:
+        return True
     except Exception as e:
         if logger:
             logger.error(f"Failed to remove file {filepath}: {e}")
         return False
+    if logger:
+        logger.debug(f"Removed file: {filepath}")
     return True
 
 
@@ -116,26 +190,89 @@ class RecordingTimer:
     def __init__(self):
         self.start_time: float | None = None
         self.is_running = False
+        self.is_paused = False
+        self._paused_at: float | None = None
+        self._listeners: list[Callable[[str], None]] = []
+        self._display = None
+        self._display_text: str | None = None
+
+    def register_listener(self, callback: Callable[[str], None]):
+        """Call back with the formatted elapsed time whenever the state changes."""
+        self._listeners.append(callback)
+
+    def unregister_listener(self, callback: Callable[[str], None]):
+        """Stop calling back a registered listener."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def bind_display(self, display):
+        """Show the elapsed time in ``display`` (e.g. a StringVar), or None to stop."""
+        self._display = display
+        self._display_text = None
+
+    def refresh_display(self):
+        """Write the formatted elapsed time to the bound display, if it changed."""
+        if self._display is None:
+            return
+        text = self.get_formatted_elapsed()
+        if text != self._display_text:
+            self._display.set(text)
+            self._display_text = text
+
+    def seconds_to_next_tick(self) -> float:
+        """Get the time until the elapsed time reaches its next whole second."""
+        return 1.0 - self.get_elapsed() % 1.0
+
+    def _notify(self):
+        elapsed = self.get_formatted_elapsed()
+        for callback in list(self._listeners):
+            callback(elapsed)
 
     def start(self):
         """Start the timer."""
         self.start_time = time.time()
         self.is_running = True
+        self.is_paused = False
+        self._paused_at = None
+        self._notify()
 
     def stop(self):
         """Stop the timer."""
         self.is_running = False
+        self._notify()
+
+    def pause(self):
+        """Pause the timer, so the paused time is not counted."""
+        if not self.is_running or self.is_paused:
+            return
+        self._paused_at = time.time()
+        self.is_paused = True
+        self._notify()
+
+    def resume(self):
+        """Resume a paused timer."""
+        if not self.is_paused:
+            return
+        if self.start_time is not None and self._paused_at is not None:
+            self.start_time += time.time() - self._paused_at
+        self._paused_at = None
+        self.is_paused = False
+        self._notify()
 
     def reset(self):
         """Reset the timer."""
         self.start_time = None
         self.is_running = False
+        self.is_paused = False
+        self._paused_at = None
+        self._notify()
 
     def get_elapsed(self) -> float:
         """Get elapsed time in seconds."""
         if self.start_time is None:
             return 0.0
-        return time.time() - self.start_time
+        now = self._paused_at if self._paused_at is not None else time.time()
+        return now - self.start_time
 
     def get_formatted_elapsed(self) -> str:
         """Get formatted elapsed time."""
@@ -153,7 +290,7 @@ class CallbackLogger:
 
     def debug(self, msg: str):
         self.logger.debug(msg)
-        if self.callback:
+        if self.callback and self.logger.isEnabledFor(logging.DEBUG):
             self.callback(f"DEBUG: {msg}")
 
     def info(self, msg: str):
@@ -174,44 +311,21 @@ class CallbackLogger:
 
 def check_dependencies() -> dict[str, bool]:
     """Check if required system dependencies are available."""
-    dependencies = {}
-
-    # Check for ffmpeg
-    try:
-        import subprocess
-
-        result = subprocess.run(["ffmpeg", "-version"], capture_output=True, timeout=5)
-        dependencies["ffmpeg"] = result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        dependencies["ffmpeg"] = False
-
-    # Check for pactl (PulseAudio)
-    try:
-        result = subprocess.run(["pactl", "--version"], capture_output=True, timeout=5)
-        dependencies["pulseaudio"] = result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        dependencies["pulseaudio"] = False
-
-    # Check Python packages
-    try:
-        import cv2  # noqa: F401
+    return dict(_probe_dependencies())
 
-        dependencies["opencv"] = True
-    except ImportError:
-        dependencies["opencv"] = False
 
-    try:
-        import mss  # noqa: F401
-
-        dependencies["mss"] = True
-    except ImportError:
-        dependencies["mss"] = False
-
-    try:
-        import numpy  # noqa: F401
+@functools.lru_cache(maxsize=1)
+def _probe_dependencies() -> tuple[tuple[str, bool], ...]:
+    """Probe the dependencies once; they don't change while the app runs."""
+    # Look the tools up on PATH rather than running each one
+    dependencies = [
+        ("ffmpeg", shutil.which("ffmpeg") is not None),
+        ("pulseaudio", shutil.which("pactl") is not None),
+    ]
 
-        dependencies["numpy"] = True
-    except ImportError:
-        dependencies["numpy"] = False
+    # Check Python packages without importing them, which would load the
+    # heavy frame libraries at start-up
+    for name, module in (("opencv", "cv2"), ("mss", "mss"), ("numpy", "numpy")):
+        dependencies.append((name, importlib.util.find_spec(module) is not None))
 
-    return dependencies
+    return tuple(dependencies)
@@ -1,17 +1,79 @@
 """Video capture functionality for the screen recorder."""
 
 import logging
+import os
+import queue
+import shutil
 import subprocess
+import tempfile
 import threading
 import time
+import traceback
 from collections.abc import Callable
 from pathlib import Path
+from typing import IO, TYPE_CHECKING
 
-import cv2
 import mss
-import numpy as np
 
-from utils import CallbackLogger, safe_remove_file
+from utils import CallbackLogger, safe_remove_file, stat_file
+
+if TYPE_CHECKING:
+    import cv2
+    import numpy as np
+
+
+def _import_frame_libs() -> None:
+    """Import OpenCV and NumPy on first use.
+
+    Together they take a noticeable part of a second to import, and nothing
+    needs them until a recording starts, so the window opens without them.
+    """
+    global cv2, np
+    import cv2
+    import numpy as np
+
+
+# OpenCV fourcc codes, packed the way cv2.VideoWriter_fourcc packs them so
+# they are built once at import without loading OpenCV
+CODEC_FOURCCS = {
+    codec: int.from_bytes(codec.encode("ascii"), "little")
+    for codec in ("XVID", "MJPG", "mp4v", "H264", "VP80", "VP90")
+}
+
+# Memory-backed directory OpenCV-written videos can be staged in when a
+# recorder opts in, used only while it has room for a long recording
+STAGING_DIR = "/dev/shm"
+STAGING_MIN_FREE = 4 * 1024**3
+
+# Queued in place of a frame buffer when the screen has not changed, telling
+# the encoder to write its previous frame again
+REPEAT_FRAME = object()
+
+# How long a merge may run in total, and how long it may go without
+# reporting progress before it is considered hung (seconds)
+MERGE_TIMEOUT = 7200
+MERGE_STALL_TIMEOUT = 60
+
+# Containers whose index ffmpeg should move to the front once written, so
+# the file plays and streams without being read to the end first
+FASTSTART_CONTAINERS = (".mp4", ".mov")
+
+# How much of ffmpeg's stderr is kept for error messages, from the end
+STDERR_TAIL_BYTES = 64 * 1024
+
+
+def _container_args(output_path: str) -> list[str]:
+    """Get the ffmpeg muxer options for the output's container."""
+    if Path(output_path).suffix.lower() in FASTSTART_CONTAINERS:
+        return ["-movflags", "+faststart"]
+    return []
+
+
+def _read_log_tail(log_file: IO[bytes], limit: int = STDERR_TAIL_BYTES) -> str:
+    """Read the end of an ffmpeg stderr file, where its errors are."""
+    size = log_file.seek(0, os.SEEK_END)
+    log_file.seek(max(0, size - limit))
+    return log_file.read().decode(errors="replace")
 
 
 class VideoCaptureError(Exception):
@@ -20,6 +82,226 @@ class VideoCaptureError(Exception):
     pass
 
 
+class FFmpegVideoWriter:
+    """Pipes raw BGRA frames into an ffmpeg H.264 encoder, preferring hardware.
+
+    Mirrors the parts of the cv2.VideoWriter interface the recorder relies on
+    (write, isOpened, release) so it can be used interchangeably. When given a
+    PulseAudio source it also records and muxes the audio in the same process.
+    """
+
+    # Encoders tried in order: (options before the input, options after it)
+    HW_ENCODERS = {
+        "h264_nvenc": ([], ["-preset", "p1", "-pix_fmt", "yuv420p"]),
+        "h264_qsv": ([], ["-preset", "veryfast", "-pix_fmt", "nv12"]),
+        "h264_vaapi": (
+            ["-vaapi_device", "/dev/dri/renderD128"],
+            ["-vf", "format=nv12,hwupload"],
+        ),
+    }
+    SW_ENCODER = ("libx264", ([], ["-preset", "ultrafast", "-pix_fmt", "yuv420p"]))
+
+    # Frames are taken exactly as mss captures them (B, G, R, unused byte), so
+    # ffmpeg's single colour conversion pass replaces a separate alpha drop
+    CHANNELS = 4
+
+    # Containers that accept H.264 video alongside AAC audio
+    AUDIO_CONTAINERS = ("mp4", "mkv", "mov", "avi")
+
+    _encoder: tuple[str, tuple[list[str], list[str]]] | None = None
+    _encoder_lock = threading.Lock()
+
+    def __init__(
+        self,
+        output_file: str,
+        fps: float,
+        screen_size: tuple[int, int],
+        logger: CallbackLogger,
+        audio_source: str | None = None,
+        sample_rate: int = 48000,
+        channels: int = 2,
+        audio_bitrate: str = "128k",
+        audio_delay_ms: int = 0,
+    ):
+        self.callback_logger = logger
+        name, (input_args, output_args) = self._select_encoder()
+
+        audio_input_args: list[str] = []
+        audio_output_args: list[str] = []
+        if audio_source:
+            audio_input_args = [
+                # Fixed 10 ms s16 fragments keep pulse's callback rate at
+                # 100/s, and the deeper queue absorbs encoder stalls
+                "-thread_queue_size",
+                "1024",
+                "-fragment_size",
+                str(sample_rate * channels * 2 // 100),
+                "-probesize",
+                "32",
+                "-analyzeduration",
+                "0",
+                "-f",
+                "pulse",
+                "-sample_rate",
+                str(sample_rate),
+                "-channels",
+                str(channels),
+                "-i",
+                audio_source,
+            ]
+            audio_output_args = [
+                "-c:a",
+                "aac",
+                "-b:a",
+                audio_bitrate,
+                "-af",
+                self._audio_filter(audio_delay_ms),
+                # The pulse input never ends on its own; stop with the video
+                "-shortest",
+            ]
+
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-loglevel",
+            "error",
+            "-nostats",
+            *input_args,
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "bgr0",
+            "-s",
+            f"{screen_size[0]}x{screen_size[1]}",
+            "-r",
+            str(fps),
+            "-i",
+            "-",
+            *audio_input_args,
+            "-c:v",
+            name,
+            *output_args,
+            *audio_output_args,
+            *_container_args(output_file),
+            output_file,
+        ]
+        self.callback_logger.info(f"Encoding video with ffmpeg ({name})")
+        # Nothing reads stderr until release, and a full pipe would stall
+        # ffmpeg mid-recording, so it goes to an unlinked temp file instead
+        self._stderr_log = tempfile.TemporaryFile()
+        # Unbuffered, so frames go from the array's memory to the pipe
+        # without passing through an intermediate Python buffer
+        self.process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=self._stderr_log,
+            bufsize=0,
+        )
+
+    @classmethod
+    def _select_encoder(cls) -> tuple[str, tuple[list[str], list[str]]]:
+        """Get the encoder to use, probing for it once per process."""
+        with cls._encoder_lock:
+            if cls._encoder is None:
+                cls._encoder = cls._probe_encoder()
+        return cls._encoder
+
+    @classmethod
+    def prewarm(cls) -> None:
+        """Probe encoders in the background so the first recording needn't wait."""
+        threading.Thread(target=cls._select_encoder, daemon=True).start()
+
+    @classmethod
+    def _probe_encoder(cls) -> tuple[str, tuple[list[str], list[str]]]:
+        """Pick the first hardware encoder that actually works."""
+        try:
+            listed = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-encoders"],
+                capture_output=True,
+                text=True,
+                timeout=10,
+            ).stdout
+        except (OSError, subprocess.TimeoutExpired):
+            listed = ""
+
+        for name, (input_args, output_args) in cls.HW_ENCODERS.items():
+            if name not in listed:
+                continue
+            # Being listed only means ffmpeg was built with it; a one frame
+            # trial encode confirms the device and driver are usable
+            trial = [
+                "ffmpeg",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                *input_args,
+                "-f",
+                "lavfi",
+                "-i",
+                "color=black:size=256x256",
+                "-frames:v",
+                "1",
+                "-c:v",
+                name,
+                *output_args,
+                "-f",
+                "null",
+                "-",
+            ]
+            try:
+                result = subprocess.run(trial, capture_output=True, timeout=10)
+            except (OSError, subprocess.TimeoutExpired):
+                continue
+            if result.returncode == 0:
+                return name, (input_args, output_args)
+
+        return cls.SW_ENCODER
+
+    @staticmethod
+    def _audio_filter(audio_delay_ms: int) -> str:
+        """Build the audio filter that applies the configured delay compensation."""
+        # Timestamp audio by sample count like the piped video is by frame
+        # count, so capture start-up jitter does not shift one against the other
+        if audio_delay_ms > 0:
+            return f"asetpts=N/SR/TB,adelay={audio_delay_ms}:all=1"
+        if audio_delay_ms < 0:
+            return f"atrim=start={abs(audio_delay_ms) / 1000},asetpts=N/SR/TB"
+        return "asetpts=N/SR/TB"
+
+    def isOpened(self) -> bool:  # noqa: N802 - matches cv2.VideoWriter
+        """Check whether ffmpeg is still accepting frames."""
+        return self.process.poll() is None and not self.process.stdin.closed
+
+    def write(self, frame: "np.ndarray") -> None:
+        """Send one BGRA frame to the encoder."""
+        # A raw pipe write may be partial, so keep going from where it stopped
+        view = memoryview(frame).cast("B")
+        while view:
+            written = self.process.stdin.write(view)
+            view = view[written:]
+
+    def release(self) -> None:
+        """Close the pipe and wait for ffmpeg to finalize the file."""
+        if self.process.stdin.closed:
+            return
+
+        # communicate() closes stdin, which is ffmpeg's end-of-stream signal
+        try:
+            self.process.communicate(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.callback_logger.warning("ffmpeg did not finish in time, killing it")
+            self.process.kill()
+            self.process.communicate()
+
+        if self.process.returncode != 0:
+            message = _read_log_tail(self._stderr_log).strip()
+            self.callback_logger.error(
+                f"ffmpeg exited with code {self.process.returncode}: {message}"
+            )
+        self._stderr_log.close()
+
+
 class ScreenRecorder:
     """Handles screen recording with improved performance and error handling."""
 
@@ -47,12 +329,23 @@ class ScreenRecorder:
         self.recording = False
         self.paused = False
         self.output_file: str | None = None
-        self.video_writer: cv2.VideoWriter | None = None
+        self.video_writer: cv2.VideoWriter | FFmpegVideoWriter | None = None
         self.recording_thread: threading.Thread | None = None
+        # Set on stop so idle waits in the capture loop end at once
+        self._stop_event = threading.Event()
+        self.staging_file: str | None = None
+        self.audio_input: dict | None = None
+        # Files a muxed recording was written to, one per stretch between pauses
+        self._segments: list[str] = []
+        # What _tune_capture_thread changed, so it can be undone
+        self._capture_tuning: dict = {}
 
         # Performance settings
-        self.frame_buffer_size = 30  # frames to buffer
+        self.frame_buffer_size = 4  # frames to buffer between capture and encode
         self.frame_drop_threshold = 0.1  # seconds
+        # Write OpenCV recordings to STAGING_DIR and move them on stop; off by
+        # default, since the whole file sits in RAM and is lost on a crash
+        self.stage_in_memory = False
 
         # Statistics
         self.frames_recorded = 0
@@ -63,80 +356,185 @@ class ScreenRecorder:
         self.logger = logging.getLogger(__name__)
         self.callback_logger = CallbackLogger(self.logger, log_callback)
 
+        # One screen grabber per thread for the recorder's lifetime, so the
+        # display connection and capture resources are allocated once and
+        # never shared across threads (older mss releases are not safe to)
+        self._local = threading.local()
+        self._grabbers: list = []
+        self._grabbers_lock = threading.Lock()
+
         # Validate monitor index
         self._validate_monitor_index()
+        self._monitor = self._sct().monitors[self.monitor_index]
+
+    def __del__(self):
+        self.close()
+
+    def _sct(self):
+        """Get the calling thread's mss instance, opening it on first use."""
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            try:
+                sct = mss.mss()
+            except Exception as e:
+                raise VideoCaptureError(f"Failed to open screen capture: {e}")
+            self._local.sct = sct
+            with self._grabbers_lock:
+                self._grabbers.append(sct)
+        return sct
+
+    def _close_thread_sct(self) -> None:
+        """Close the calling thread's mss instance, if it opened one."""
+        sct = getattr(self._local, "sct", None)
+        if sct is not None:
+            self._local.sct = None
+            with self._grabbers_lock:
+                self._grabbers.remove(sct)
+            sct.close()
+
+    def close(self) -> None:
+        """Release the screen capture resources."""
+        lock = getattr(self, "_grabbers_lock", None)
+        if lock is None:
+            return
+        with lock:
+            grabbers, self._grabbers = self._grabbers, []
+        for sct in grabbers:
+            sct.close()
+        self._local = threading.local()
 
     def _validate_monitor_index(self) -> None:
         """Validate that the monitor index is available."""
-        try:
-            with mss.mss() as sct:
-                if self.monitor_index < 1 or self.monitor_index >= len(sct.monitors):
-                    raise VideoCaptureError(
-                        f"Invalid monitor index: {self.monitor_index}. "
-                        f"Available monitors: 1-{len(sct.monitors) - 1}"
-                    )
-        except Exception as e:
-            raise VideoCaptureError(f"Failed to validate monitor: {e}")
+        monitors = self._sct().monitors
+        if self.monitor_index < 1 or self.monitor_index >= len(monitors):
+            self.close()
+            raise VideoCaptureError(
+                f"Failed to validate monitor: Invalid monitor index: {self.monitor_index}. "
+                f"Available monitors: 1-{len(monitors) - 1}"
+            )
 
     def get_screen_info(self) -> dict:
         """Get information about the selected screen."""
+        monitor = self._monitor
+        return {
+            "width": monitor["width"],
+            "height": monitor["height"],
+            "left": monitor["left"],
+            "top": monitor["top"],
+        }
+
+    @staticmethod
+    def _describe_monitors(monitors: list[dict]) -> list[dict]:
+        """Describe each physical monitor, skipping mss's combined one."""
+        return [
+            {
+                "index": i,
+                "width": monitor["width"],
+                "height": monitor["height"],
+                "left": monitor["left"],
+                "top": monitor["top"],
+                "name": f"Screen {i}",
+            }
+            for i, monitor in enumerate(monitors[1:], 1)
+        ]
+
+    @staticmethod
+    def enumerate_monitors() -> list[dict]:
+        """Detect available screens without constructing a recorder."""
         try:
             with mss.mss() as sct:
-                monitor = sct.monitors[self.monitor_index]
-                return {
-                    "width": monitor["width"],
-                    "height": monitor["height"],
-                    "left": monitor["left"],
-                    "top": monitor["top"],
-                }
+                return ScreenRecorder._describe_monitors(sct.monitors)
         except Exception as e:
-            raise VideoCaptureError(f"Failed to get screen info: {e}")
+            raise VideoCaptureError(f"Failed to detect screens: {e}")
 
     def detect_screens(self) -> list[dict]:
         """Detect available screens/monitors."""
         try:
-            with mss.mss() as sct:
-                screens = []
-                for i, monitor in enumerate(
-                    sct.monitors[1:], 1
-                ):  # Skip first (combined) monitor
-                    screens.append(
-                        {
-                            "index": i,
-                            "width": monitor["width"],
-                            "height": monitor["height"],
-                            "left": monitor["left"],
-                            "top": monitor["top"],
-                            "name": f"Screen {i}",
-                        }
-                    )
-                return screens
+            return self._describe_monitors(self._sct().monitors)
         except Exception as e:
             raise VideoCaptureError(f"Failed to detect screens: {e}")
 
-    def _get_codec_fourcc(self, codec: str) -> int:
-        """Get OpenCV fourcc code for codec."""
-        codec_map = {
-            "XVID": cv2.VideoWriter_fourcc(*"XVID"),
-            "MJPG": cv2.VideoWriter_fourcc(*"MJPG"),
-            "mp4v": cv2.VideoWriter_fourcc(*"mp4v"),
-            "H264": cv2.VideoWriter_fourcc(*"H264"),
-            "VP80": cv2.VideoWriter_fourcc(*"VP80"),
-            "VP90": cv2.VideoWriter_fourcc(*"VP90"),
+    def _uses_ffmpeg(self) -> bool:
+        """Check whether recordings will be encoded by FFmpegVideoWriter."""
+        return self.codec == "H264" and shutil.which("ffmpeg") is not None
+
+    def prewarm_encoder(self) -> None:
+        """Start probing the ffmpeg encoder while the rest of setup runs."""
+        if self._uses_ffmpeg():
+            FFmpegVideoWriter.prewarm()
+
+    def attach_audio(
+        self,
+        source: str,
+        container: str,
+        sample_rate: int = 48000,
+        channels: int = 2,
+        bitrate: str = "128k",
+        delay_ms: int = 0,
+    ) -> bool:
+        """Record a PulseAudio source in the video encoder itself.
+
+        Returns False when the current codec or container cannot mux audio,
+        in which case the caller should record and merge audio separately.
+        """
+        if (
+            not self._uses_ffmpeg()
+            or container not in FFmpegVideoWriter.AUDIO_CONTAINERS
+        ):
+            return False
+
+        self.audio_input = {
+            "audio_source": source,
+            "sample_rate": sample_rate,
+            "channels": channels,
+            "audio_bitrate": bitrate,
+            "audio_delay_ms": delay_ms,
         }
+        self.callback_logger.info(f"Muxing audio from {source} while encoding")
+        return True
 
-        if codec not in codec_map:
+    def _get_codec_fourcc(self, codec: str) -> int:
+        """Get OpenCV fourcc code for codec."""
+        if codec not in CODEC_FOURCCS:
             self.callback_logger.warning(f"Unknown codec '{codec}', using XVID")
-            return codec_map["XVID"]
+            return CODEC_FOURCCS["XVID"]
 
-        return codec_map[codec]
+        return CODEC_FOURCCS[codec]
 
     def _create_video_writer(
         self, output_file: str, screen_size: tuple[int, int]
-    ) -> cv2.VideoWriter:
+    ) -> "cv2.VideoWriter | FFmpegVideoWriter":
         """Create and validate video writer."""
+        # OpenCV builds rarely ship a usable H.264 encoder, so hand H.264 to
+        # ffmpeg, which can also offload the encode to the GPU
+        if self._uses_ffmpeg():
+            writer = FFmpegVideoWriter(
+                output_file,
+                self.fps,
+                screen_size,
+                self.callback_logger,
+                **(self.audio_input or {}),
+            )
+            if not writer.isOpened():
+                raise VideoCaptureError("Failed to start ffmpeg video encoder")
+            return writer
+
+        _import_frame_libs()
         fourcc = self._get_codec_fourcc(self.codec)
 
+        # OpenCV flushes each frame in small writes; on tmpfs those stay in
+        # memory and the finished file is moved to its destination once
+        if (
+            self.stage_in_memory
+            and Path(STAGING_DIR).is_dir()
+            and shutil.disk_usage(STAGING_DIR).free >= STAGING_MIN_FREE
+        ):
+            self.staging_file = str(
+                Path(STAGING_DIR) / f"{os.getpid()}_{Path(output_file).name}"
+            )
+            output_file = self.staging_file
+            self.callback_logger.info(f"Staging video in {self.staging_file}")
+
         writer = cv2.VideoWriter(output_file, fourcc, self.fps, screen_size)
 
         if not writer.isOpened():
@@ -148,7 +546,10 @@ class ScreenRecorder:
 
     def _recording_loop(self) -> None:
         """Main recording loop running in separate thread."""
+        _import_frame_libs()
         video_writer = None
+        encoder_thread = None
+        segmented = False
         try:
             self.callback_logger.info("=== VIDEO RECORDING LOOP STARTED ===")
             screen_info = self.get_screen_info()
@@ -170,77 +571,173 @@ class ScreenRecorder:
             consecutive_errors = 0
             max_consecutive_errors = 10
 
-            with mss.mss() as sct:
-                monitor = sct.monitors[self.monitor_index]
-
-                while self.recording and consecutive_errors < max_consecutive_errors:
-                    if self.paused:
-                        time.sleep(0.1)
-                        consecutive_errors = 0  # Reset error count when paused
-                        continue
-
-                    frame_start = time.time()
-
-                    try:
-                        # Capture frame
-                        screenshot = sct.grab(monitor)
-                        frame = np.array(screenshot)[:, :, :3]  # Remove alpha channel
-
-                        # MSS captures in BGRA format, removing alpha gives us BGR
-                        # OpenCV VideoWriter expects BGR format, so no conversion needed
+            # Reused frame buffers cycled between this loop and the encoder
+            # thread, so frames are never reallocated and a slow write never
+            # stalls the next grab. OpenCV writers need BGR, ffmpeg takes BGRA.
+            width, height = screen_size
+            channels = getattr(video_writer, "CHANNELS", 3)
+            free_frames: queue.Queue[np.ndarray] = queue.Queue()
+            for _ in range(self.frame_buffer_size):
+                free_frames.put(np.empty((height, width, channels), dtype=np.uint8))
+            ready_frames: queue.Queue[np.ndarray | None] = queue.Queue()
+
+            encoder_thread = self._start_encoder(
+                video_writer, ready_frames, free_frames
+            )
+            # Muxed audio keeps flowing into the encoder while no frames do,
+            # so a pause ends the file and resuming starts the next one
+            segmented = self.audio_input is not None
+            self._segments = [self.output_file]
+
+            # Only now, so the encoder thread and ffmpeg do not inherit these
+            self._tune_capture_thread()
+
+            # Hoisted out of the loop to skip attribute lookups per frame
+            grab = self._sct().grab
+            monitor = self._monitor
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            writer_opened = video_writer.isOpened
+            put_ready = ready_frames.put
+            ready_count = ready_frames.qsize
+            pool_size = self.frame_buffer_size
+            get_free = free_frames.get_nowait
+            frombuffer = np.frombuffer
+            cvt_color = cv2.cvtColor
+            perf_counter = time.perf_counter
+            sleep = time.sleep
+            wait_for_stop = self._stop_event.wait
+            drop_threshold = self.frame_drop_threshold
+
+            # Frames are paced against an absolute monotonic schedule, so
+            # sleep overshoot does not accumulate into drift
+            next_frame = time.perf_counter()
+            previous_raw = None
+
+            while self.recording and consecutive_errors < max_consecutive_errors:
+                if self.paused:
+                    if segmented and video_writer is not None:
+                        self._stop_encoder(encoder_thread, ready_frames)
+                        encoder_thread = None
+                        video_writer.release()
+                        video_writer = self.video_writer = None
+                        previous_raw = None
+                        self.callback_logger.info(
+                            f"Ended video segment {self._segments[-1]} for the pause"
+                        )
+                    wait_for_stop(0.1)
+                    consecutive_errors = 0  # Reset error count when paused
+                    next_frame = perf_counter()
+                    continue
 
-                        # Verify frame dimensions match expected size
-                        if frame.shape[:2] != (screen_size[1], screen_size[0]):
-                            self.callback_logger.warning(
-                                f"Frame size mismatch: got {frame.shape[:2]}, expected {(screen_size[1], screen_size[0])}"
+                try:
+                    if video_writer is None:
+                        base, ext = os.path.splitext(self.output_file)
+                        segment = f"{base}.part{len(self._segments)}{ext}"
+                        self._untune_capture_thread()
+                        try:
+                            video_writer = self._create_video_writer(
+                                segment, screen_size
                             )
-                            continue
-
-                        # Write frame - ensure writer is still valid
-                        if video_writer and video_writer.isOpened():
-                            video_writer.write(frame)
-                            self.frames_recorded += 1
-                            consecutive_errors = (
-                                0  # Reset error count on successful write
+                            encoder_thread = self._start_encoder(
+                                video_writer, ready_frames, free_frames
                             )
+                        finally:
+                            self._tune_capture_thread()
+                        self.video_writer = video_writer
+                        self._segments.append(segment)
+                        writer_opened = video_writer.isOpened
+                        self.callback_logger.info(
+                            f"Started video segment {segment} after the pause"
+                        )
 
-                            # Log every 60 frames (about once per second at 60fps)
-                            if self.frames_recorded % 60 == 0:
-                                self.callback_logger.info(
-                                    f"Recorded {self.frames_recorded} frames"
-                                )
+                    # Capture frame
+                    screenshot = grab(monitor)
+
+                    # MSS captures in BGRA format; view its raw buffer without
+                    # copying, it only has to outlive the copy into the pool.
+                    # The reshape doubles as the frame size check: it only
+                    # fails if the monitor geometry changed mid-recording.
+                    try:
+                        bgra = frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+                            height, width, 4
+                        )
+                    except ValueError:
+                        self.callback_logger.error(
+                            f"Frame size changed to {screenshot.width}x{screenshot.height}, "
+                            f"expected {width}x{height}, stopping recording"
+                        )
+                        break
+
+                    # Queue frame for the encoder - ensure writer is still valid
+                    if writer_opened():
+                        # mss returns a fresh buffer per grab, so an idle screen
+                        # is caught by one early-exit memcmp against the last
+                        # buffer, skipping the copy into the pool entirely.
+                        # Repeats hold no buffer, so they are capped at the
+                        # pool size instead of piling up behind a slow encoder.
+                        if screenshot.raw == previous_raw:
+                            if ready_count() < pool_size:
+                                put_ready(REPEAT_FRAME)
+                            else:
+                                self.frames_dropped += 1
                         else:
-                            self.callback_logger.error(
-                                "Video writer is not opened, stopping recording"
-                            )
-                            break
+                            try:
+                                frame = get_free()
+                            except queue.Empty:
+                                frame = self._reclaim_oldest_frame(
+                                    ready_frames, free_frames
+                                )
+
+                            if channels == 4:
+                                np.copyto(frame, bgra)
+                            else:
+                                cvt_color(bgra, cv2.COLOR_BGRA2BGR, dst=frame)
+                            put_ready(frame)
+                            previous_raw = screenshot.raw
+                        consecutive_errors = (
+                            0  # Reset error count on successful capture
+                        )
+                    else:
+                        self.callback_logger.error(
+                            "Video writer is not opened, stopping recording"
+                        )
+                        break
 
-                        # Frame timing - ensure consistent frame rate
-                        frame_time = time.time() - frame_start
-                        sleep_time = max(0.0, frame_delay - frame_time)
+                    # Frame timing - sleep until this frame's slot ends
+                    next_frame += frame_delay
+                    sleep_time = next_frame - perf_counter()
 
-                        # Always sleep for the remaining frame time to maintain consistent FPS
-                        if sleep_time > 0:
-                            time.sleep(sleep_time)
-                        elif frame_time > frame_delay + self.frame_drop_threshold:
+                    if sleep_time > 0:
+                        sleep(sleep_time)
+                    else:
+                        if -sleep_time > drop_threshold:
                             # Only count as dropped if significantly over time
                             self.frames_dropped += 1
-                            self.logger.debug(
-                                f"Frame processing took {frame_time:.3f}s (target: {frame_delay:.3f}s)"
-                            )
+                            if debug_enabled:
+                                self.logger.debug(
+                                    f"Frame ran {-sleep_time:.3f}s past its slot (target: {frame_delay:.3f}s)"
+                                )
+                        # Restart the schedule instead of bursting to catch up
+                        next_frame = perf_counter()
 
-                    except Exception as e:
-                        consecutive_errors += 1
+                except Exception as e:
+                    consecutive_errors += 1
+                    self.callback_logger.error(
+                        f"Error capturing frame (attempt {consecutive_errors}/{max_consecutive_errors}): {e}"
+                    )
+                    if consecutive_errors >= max_consecutive_errors:
                         self.callback_logger.error(
-                            f"Error capturing frame (attempt {consecutive_errors}/{max_consecutive_errors}): {e}"
+                            "Too many consecutive errors, stopping recording"
                         )
-                        if consecutive_errors >= max_consecutive_errors:
-                            self.callback_logger.error(
-                                "Too many consecutive errors, stopping recording"
-                            )
-                            break
-                        # Small delay before retrying
-                        time.sleep(0.1)
+                        break
+                    # Small delay before retrying
+                    wait_for_stop(0.1)
+
+            # Let the encoder write out every frame still queued; stopped
+            # while paused, a segmented recording has none running
+            if encoder_thread:
+                self._stop_encoder(encoder_thread, ready_frames)
+                encoder_thread = None
 
             self.callback_logger.info(
                 f"=== RECORDING LOOP ENDED - Recorded {self.frames_recorded} frames ==="
@@ -251,21 +748,21 @@ class ScreenRecorder:
 
         except Exception as e:
             self.callback_logger.error(f"Recording failed with exception: {e}")
-            import traceback
-
             self.callback_logger.error(f"Traceback: {traceback.format_exc()}")
 
         finally:
+            if encoder_thread:
+                self._stop_encoder(encoder_thread, ready_frames)
+
             # Always clean up video writer in finally block to ensure proper file closure
             self.callback_logger.info("=== VIDEO WRITER CLEANUP STARTED ===")
             try:
                 if video_writer:
                     self.callback_logger.info("Releasing video writer...")
+                    # Returns once the file is closed (ffmpeg has exited)
                     video_writer.release()
-                    # Add a small delay to ensure file is fully written to disk
-                    time.sleep(0.5)
                     self.callback_logger.info("Video writer released successfully")
-                else:
+                elif not segmented:
                     self.callback_logger.warning("Video writer was None during cleanup")
             except Exception as e:
                 self.callback_logger.error(
@@ -274,12 +771,14 @@ class ScreenRecorder:
             finally:
                 self.video_writer = None
                 self.callback_logger.info("Video writer reference cleared")
+                self._move_staged_file()
+                self._close_thread_sct()
 
             # Check if video file was created and has content
-            if self.output_file and Path(self.output_file).exists():
-                file_size = Path(self.output_file).stat().st_size
+            output_st = stat_file(self.output_file)
+            if output_st:
                 self.callback_logger.info(
-                    f"✓ Video file created: {self.output_file} ({file_size} bytes, {self.frames_recorded} frames)"
+                    f"✓ Video file created: {self.output_file} ({output_st.st_size} bytes, {self.frames_recorded} frames)"
                 )
             else:
                 self.callback_logger.error(
@@ -293,6 +792,208 @@ class ScreenRecorder:
                 f"{self.frames_dropped} dropped, {total_time:.1f}s ==="
             )
 
+    def _move_staged_file(self) -> None:
+        """Move a video written to the staging directory to its destination."""
+        if not self.staging_file:
+            return
+
+        staging_file, self.staging_file = self.staging_file, None
+        try:
+            if os.access(staging_file, os.F_OK):
+                shutil.move(staging_file, self.output_file)
+                self.callback_logger.info(f"Moved staged video to {self.output_file}")
+        except OSError as e:
+            self.callback_logger.error(f"Failed to move staged video: {e}")
+
+    def _join_segments(self) -> None:
+        """Append the segments recorded after each resume to the output file."""
+        if len(self._segments) < 2:
+            return
+
+        base, ext = os.path.splitext(self.output_file)
+        joined_file = f"{base}.joined{ext}"
+        list_file = f"{base}.segments.txt"
+        try:
+            with open(list_file, "w") as f:
+                for segment in self._segments:
+                    escaped = os.path.abspath(segment).replace("'", "'\\''")
+                    f.write(f"file '{escaped}'\n")
+
+            # Every segment has the same codecs and parameters, so the concat
+            # demuxer can join them without re-encoding
+            result = subprocess.run(
+                [
+                    "ffmpeg",
+                    "-y",
+                    "-loglevel",
+                    "error",
+                    "-nostats",
+                    "-f",
+                    "concat",
+                    "-safe",
+                    "0",
+                    "-i",
+                    list_file,
+                    "-c",
+                    "copy",
+                    *_container_args(joined_file),
+                    joined_file,
+                ],
+                capture_output=True,
+                text=True,
+                timeout=MERGE_TIMEOUT,
+            )
+            if result.returncode != 0:
+                raise VideoCaptureError(
+                    result.stderr.strip() or f"ffmpeg exited with {result.returncode}"
+                )
+            os.replace(joined_file, self.output_file)
+        except (OSError, subprocess.TimeoutExpired, VideoCaptureError) as e:
+            # Keep every part, so nothing recorded after a pause is lost
+            self.callback_logger.error(
+                f"Failed to join video segments ({e}), keeping them: "
+                f"{', '.join(self._segments)}"
+            )
+            safe_remove_file(joined_file, self.logger)
+            return
+        finally:
+            safe_remove_file(list_file, self.logger)
+
+        self.callback_logger.info(
+            f"Joined {len(self._segments)} video segments around pauses"
+        )
+        for segment in self._segments[1:]:
+            safe_remove_file(segment, self.logger)
+        self._segments = [self.output_file]
+
+    def _tune_capture_thread(self) -> None:
+        """Pin the calling capture thread to one core and raise its priority.
+
+        Steadier wake-ups mean fewer missed frame slots. Every step is best
+        effort: it needs Linux, and the priority changes need CAP_SYS_NICE.
+        What was changed is kept in _capture_tuning for _untune_capture_thread.
+        """
+        if not hasattr(os, "sched_setaffinity"):
+            return
+
+        try:
+            # Stay off CPU 0, which services most interrupts on a typical desktop
+            cpus = sorted(os.sched_getaffinity(0))
+            if len(cpus) > 1:
+                os.sched_setaffinity(0, {cpus[-1]})
+                self._capture_tuning["cpus"] = set(cpus)
+                self.callback_logger.debug(f"Capture thread pinned to CPU {cpus[-1]}")
+        except OSError as e:
+            self.callback_logger.debug(f"Could not pin capture thread: {e}")
+
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+            self._capture_tuning["fifo"] = True
+            self.callback_logger.debug("Capture thread running with SCHED_FIFO")
+            return
+        except (OSError, AttributeError) as e:
+            self.callback_logger.debug(f"SCHED_FIFO unavailable ({e}), trying nice")
+
+        try:
+            os.nice(-5)
+            self._capture_tuning["nice"] = True
+            self.callback_logger.debug("Capture thread niceness raised by 5")
+        except OSError as e:
+            self.callback_logger.debug(f"Keeping default capture priority: {e}")
+
+    def _untune_capture_thread(self) -> None:
+        """Undo _tune_capture_thread on the calling capture thread.
+
+        Threads and processes inherit the affinity and priority of the thread
+        that starts them, so this runs before a new segment's encoder starts.
+        """
+        tuning, self._capture_tuning = self._capture_tuning, {}
+        try:
+            if "cpus" in tuning:
+                os.sched_setaffinity(0, tuning["cpus"])
+            if "fifo" in tuning:
+                os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+            if "nice" in tuning:
+                os.nice(5)
+        except OSError as e:
+            self.callback_logger.debug(f"Could not reset capture thread tuning: {e}")
+
+    def _encoder_loop(
+        self,
+        video_writer: "cv2.VideoWriter | FFmpegVideoWriter",
+        ready_frames: queue.Queue,
+        free_frames: queue.Queue,
+    ) -> None:
+        """Write captured frames until a None sentinel arrives, recycling buffers."""
+        # The last written frame is held back from the pool so REPEAT_FRAME
+        # can write it again
+        last_frame = None
+        while True:
+            frame = ready_frames.get()
+            if frame is None:
+                break
+            if frame is REPEAT_FRAME:
+                if last_frame is None:
+                    continue
+                frame = last_frame
+
+            try:
+                video_writer.write(frame)
+                self.frames_recorded += 1
+
+                # Log every 60 frames (about once per second at 60fps)
+                if self.frames_recorded % 60 == 0:
+                    self.callback_logger.info(f"Recorded {self.frames_recorded} frames")
+            except Exception as e:
+                self.callback_logger.error(f"Error writing frame: {e}")
+
+            if frame is not last_frame:
+                if last_frame is not None:
+                    free_frames.put(last_frame)
+                last_frame = frame
+
+        # Hand the held frame back too, for the next segment's encoder
+        if last_frame is not None:
+            free_frames.put(last_frame)
+
+    def _start_encoder(
+        self,
+        video_writer: "cv2.VideoWriter | FFmpegVideoWriter",
+        ready_frames: queue.Queue,
+        free_frames: queue.Queue,
+    ) -> threading.Thread:
+        """Start an encoder thread writing queued frames to video_writer."""
+        encoder_thread = threading.Thread(
+            target=self._encoder_loop,
+            args=(video_writer, ready_frames, free_frames),
+            daemon=True,
+        )
+        encoder_thread.start()
+        return encoder_thread
+
+    def _reclaim_oldest_frame(
+        self, ready_frames: queue.Queue, free_frames: queue.Queue
+    ) -> "np.ndarray":
+        """Take back the oldest queued buffer when the encoder is behind."""
+        while True:
+            try:
+                item = ready_frames.get_nowait()
+            except queue.Empty:
+                # The encoder holds every buffer; wait for it to return one
+                return free_frames.get(timeout=1.0)
+
+            self.frames_dropped += 1
+            if item is not REPEAT_FRAME:
+                self.logger.debug("Encoder behind, dropped oldest queued frame")
+                return item
+
+    def _stop_encoder(
+        self, encoder_thread: threading.Thread, ready_frames: queue.Queue
+    ) -> None:
+        """Signal the encoder thread to finish and wait for it to drain."""
+        ready_frames.put(None)
+        encoder_thread.join()
+
     def start_recording(self, output_file: str) -> str:
         """Start screen recording."""
         if self.recording:
@@ -305,6 +1006,8 @@ class ScreenRecorder:
         self.output_file = output_file
         self.recording = True
         self.paused = False
+        self._stop_event.clear()
+        self._segments = []
         self.frames_recorded = 0
         self.frames_dropped = 0
         self.start_time = time.time()
@@ -338,6 +1041,7 @@ class ScreenRecorder:
         self.callback_logger.info("Setting recording=False and paused=False")
         self.recording = False
         self.paused = False
+        self._stop_event.set()
 
         # Wait for recording thread to finish with a longer timeout for proper cleanup
         if self.recording_thread and self.recording_thread.is_alive():
@@ -381,15 +1085,18 @@ class ScreenRecorder:
             except Exception as e:
                 self.callback_logger.error(f"Error releasing video writer: {e}")
 
+        self._move_staged_file()
+        self._join_segments()
+
         output_file = self.output_file
         self.output_file = None
         self.callback_logger.info(f"Output file path: {output_file}")
 
         # Validate the output file was created and has content
         if output_file:
-            file_path = Path(output_file)
-            if file_path.exists():
-                file_size = file_path.stat().st_size
+            output_st = stat_file(output_file)
+            if output_st:
+                file_size = output_st.st_size
                 # Check if file has reasonable size (at least 1KB per second of recording)
                 min_expected_size = max(
                     1024, self.frames_recorded * 100
@@ -448,277 +1155,99 @@ def merge_audio_video(
         callback_logger.info(f"Audio input: {audio_path}")
         callback_logger.info(f"Output path: {output_path}")
 
-        # Validate input files exist
-        if not Path(video_path).exists():
+        # Validate input files exist, stating each once for its size too
+        video_st = stat_file(video_path)
+        if not video_st:
             raise VideoCaptureError(f"Video file not found: {video_path}")
 
-        if not Path(audio_path).exists():
+        audio_st = stat_file(audio_path)
+        if not audio_st:
             raise VideoCaptureError(f"Audio file not found: {audio_path}")
 
         # Log file sizes
-        video_size = Path(video_path).stat().st_size
-        audio_size = Path(audio_path).stat().st_size
-        callback_logger.info(f"Video file size: {video_size} bytes")
-        callback_logger.info(f"Audio file size: {audio_size} bytes")
+        callback_logger.info(f"Video file size: {video_st.st_size} bytes")
+        callback_logger.info(f"Audio file size: {audio_st.st_size} bytes")
 
         # Ensure output directory exists
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
         callback_logger.info("Starting FFmpeg merge process...")
 
-        # Handle audio delay compensation
-        if audio_delay_ms != 0:
-            if audio_delay_ms > 0:
-                # Positive delay - delay audio
-                filter_complex = (
-                    f"[1:a]adelay={audio_delay_ms}|{audio_delay_ms}[delayed_audio]"
-                )
-                audio_map = "[delayed_audio]"
-            else:
-                # Negative delay - advance audio (delay video)
-                video_delay = abs(audio_delay_ms)
-                filter_complex = (
-                    f"[0:v]tpad=start_duration={video_delay / 1000}[delayed_video]"
-                )
-                audio_map = "1:a"
-
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-i",
-                video_path,
-                "-i",
-                audio_path,
-                "-c:v",
-                video_codec,
-                "-c:a",
-                audio_codec,
-                "-b:a",
-                "128k",
-                "-filter_complex",
-                filter_complex,
-                "-map",
-                "[delayed_video]" if audio_delay_ms < 0 else "0:v",
-                "-map",
-                audio_map,
-                output_path,
-            ]
-        else:
-            # No delay needed - removed -shortest flag to prevent premature ending
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-i",
-                video_path,
-                "-i",
-                audio_path,
-                "-c:v",
-                video_codec,
-                "-c:a",
-                audio_codec,
-                "-b:a",
-                "128k",
-                output_path,
-            ]
-
-        # Get video duration for progress calculation
-        total_duration = None
+        # Handle audio delay compensation by shifting one input's timestamps,
+        # which needs no filter graph, so a copied video stays copied
+        video_input = ["-i", video_path]
+        audio_input = ["-i", audio_path]
+        if audio_delay_ms > 0:
+            # Positive delay - delay audio
+            audio_input = ["-itsoffset", f"{audio_delay_ms / 1000}", *audio_input]
+        elif audio_delay_ms < 0:
+            # Negative delay - advance audio (delay video)
+            video_input = ["-itsoffset", f"{-audio_delay_ms / 1000}", *video_input]
+
+        # No -shortest flag, to prevent premature ending
+        cmd = [
+            "ffmpeg",
+            "-y",
+            *video_input,
+            *audio_input,
+            "-map",
+            "0:v",
+            "-map",
+            "1:a",
+            "-c:v",
+            video_codec,
+            "-c:a",
+            audio_codec,
+            "-b:a",
+            "128k",
+            *_container_args(output_path),
+            output_path,
+        ]
+
+        # ffprobe runs alongside the merge, since the duration is only needed
+        # once ffmpeg reports how far it has got
+        duration_probe = None
         if progress_callback:
             try:
-                # Get duration using ffprobe
-                duration_cmd = [
-                    "ffprobe",
-                    "-v",
-                    "quiet",
-                    "-show_entries",
-                    "format=duration",
-                    "-of",
-                    "csv=p=0",
-                    video_path,
-                ]
-                duration_result = subprocess.run(
-                    duration_cmd, capture_output=True, text=True, timeout=30
-                )
-                if duration_result.returncode == 0:
-                    total_duration = float(duration_result.stdout.strip())
-                    callback_logger.info(
-                        f"Video duration: {total_duration:.2f} seconds"
-                    )
-            except (ValueError, subprocess.TimeoutExpired) as e:
-                callback_logger.warning(f"Could not get video duration: {e}")
-
-        # Run FFmpeg with progress monitoring
-        if progress_callback:
-            if total_duration:
-                # Use progress format for real-time monitoring with longer timeout for big files
-                cmd.extend(["-progress", "pipe:1"])
-
-                process = subprocess.Popen(
-                    cmd,
+                duration_probe = subprocess.Popen(
+                    [
+                        "ffprobe",
+                        "-v",
+                        "quiet",
+                        "-show_entries",
+                        "format=duration",
+                        "-of",
+                        "csv=p=0",
+                        video_path,
+                    ],
                     stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
                     text=True,
-                    bufsize=1,
-                    universal_newlines=True,
                 )
-
                 progress_callback(0.0, "Starting merge...")
-
-                current_time = 0.0
-                last_progress = 0.0
-                last_output_time = time.time()
-
-                # Monitor progress output with timeout detection
-                try:
-                    while True:
-                        # Check if process is still running
-                        if process.poll() is not None:
-                            callback_logger.info("FFmpeg process has finished")
-                            break
-
-                        # Read with timeout to detect hanging
-                        import select
-                        import sys
-
-                        if sys.platform != "win32":
-                            # Use select on Unix-like systems
-                            ready, _, _ = select.select([process.stdout], [], [], 1.0)
-                            if ready:
-                                output = process.stdout.readline()
-                                if output:
-                                    last_output_time = time.time()
-                                    line = output.strip()
-                                    callback_logger.debug(f"FFmpeg output: {line}")
-
-                                    # Parse FFmpeg progress output
-                                    if line.startswith("out_time_ms="):
-                                        try:
-                                            time_ms = int(line.split("=")[1])
-                                            current_time = (
-                                                time_ms / 1000000.0
-                                            )  # Convert microseconds to seconds
-
-                                            if total_duration > 0:
-                                                progress_percent = min(
-                                                    (current_time / total_duration)
-                                                    * 100,
-                                                    100.0,
-                                                )
-                                                # Only update if progress increased significantly (reduces UI updates)
-                                                if (
-                                                    progress_percent - last_progress
-                                                    >= 1.0
-                                                ):
-                                                    progress_callback(
-                                                        progress_percent,
-                                                        f"Processing: {current_time:.1f}s / {total_duration:.1f}s",
-                                                    )
-                                                    callback_logger.info(
-                                                        f"FFmpeg progress: {progress_percent:.1f}%"
-                                                    )
-                                                    last_progress = progress_percent
-                                        except (ValueError, IndexError):
-                                            continue
-                                elif output == "":
-                                    callback_logger.info("FFmpeg stdout closed")
-                                    break
-                            else:
-                                # No output for 1 second, check timeout
-                                if (
-                                    time.time() - last_output_time > 60
-                                ):  # 60 second timeout
-                                    callback_logger.warning(
-                                        "FFmpeg appears to be hanging (no output for 60s)"
-                                    )
-                                    callback_logger.info("Terminating FFmpeg process")
-                                    process.terminate()
-                                    time.sleep(2)
-                                    if process.poll() is None:
-                                        callback_logger.warning(
-                                            "Force killing FFmpeg process"
-                                        )
-                                        process.kill()
-                                    return False
-                        else:
-                            # Windows fallback - simpler approach
-                            output = process.stdout.readline()
-                            if output == "" and process.poll() is not None:
-                                break
-                            if output:
-                                line = output.strip()
-                                if line.startswith("out_time_ms="):
-                                    try:
-                                        time_ms = int(line.split("=")[1])
-                                        current_time = time_ms / 1000000.0
-                                        if total_duration > 0:
-                                            progress_percent = min(
-                                                (current_time / total_duration) * 100,
-                                                100.0,
-                                            )
-                                            if progress_percent - last_progress >= 1.0:
-                                                progress_callback(
-                                                    progress_percent,
-                                                    f"Processing: {current_time:.1f}s / {total_duration:.1f}s",
-                                                )
-                                                last_progress = progress_percent
-                                    except (ValueError, IndexError):
-                                        continue
-
-                    # Wait for process completion
-                    stderr_output = process.communicate()[1]
-                    return_code = process.returncode
-                    callback_logger.info(
-                        f"FFmpeg finished with return code: {return_code}"
-                    )
-
-                except Exception as e:
-                    callback_logger.error(f"Error monitoring FFmpeg progress: {e}")
-                    try:
-                        process.terminate()
-                        time.sleep(2)
-                        if process.poll() is None:
-                            process.kill()
-                    except Exception:
-                        pass
-                    return False
-            else:
-                # Show indeterminate progress when duration is unknown
+            except OSError as e:
+                callback_logger.warning(f"Could not get video duration: {e}")
                 progress_callback(50.0, "Processing video... (duration unknown)")
 
-                # Fallback to simple execution without detailed progress
-                # Calculate timeout based on video duration (at least 10 minutes, max 2 hours)
-                timeout_seconds = (
-                    max(600, min(7200, total_duration * 3)) if total_duration else 3600
-                )
-                callback_logger.info(f"FFmpeg timeout set to {timeout_seconds} seconds")
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout_seconds,
-                )
-                return_code = result.returncode
-                stderr_output = result.stderr
-        else:
-            # Fallback to simple execution without progress
-            # Use conservative timeout for long files
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=7200,  # 2 hour timeout for very long recordings
+        try:
+            return_code, stderr_output = _run_ffmpeg_with_progress(
+                cmd, duration_probe, callback_logger, progress_callback
             )
-            return_code = result.returncode
-            stderr_output = result.stderr
+        finally:
+            if duration_probe and duration_probe.poll() is None:
+                duration_probe.kill()
+                duration_probe.wait()
+        if return_code is None:
+            return False
 
         if return_code == 0:
             # Check if output file was actually created and has reasonable size
-            if Path(output_path).exists():
-                output_size = Path(output_path).stat().st_size
+            output_st = stat_file(output_path)
+            if output_st:
                 if progress_callback:
                     progress_callback(100.0, "Processing complete!")
                 callback_logger.info(
-                    f"✓ Successfully merged to: {output_path} ({output_size} bytes)"
+                    f"✓ Successfully merged to: {output_path} ({output_st.st_size} bytes)"
                 )
                 callback_logger.info("=== FFMPEG MERGE COMPLETED SUCCESSFULLY ===")
                 return True
@@ -743,6 +1272,154 @@ def merge_audio_video(
         return False
 
 
+def _read_duration(
+    probe: subprocess.Popen, callback_logger: CallbackLogger
+) -> float | None:
+    """Wait for a running ffprobe and return the duration it found, in seconds."""
+    try:
+        stdout, _ = probe.communicate(timeout=30)
+        if probe.returncode == 0:
+            duration = float(stdout.strip())
+            callback_logger.info(f"Video duration: {duration:.2f} seconds")
+            return duration
+    except (ValueError, subprocess.TimeoutExpired) as e:
+        callback_logger.warning(f"Could not get video duration: {e}")
+    return None
+
+
+def _run_ffmpeg_with_progress(
+    cmd: list[str],
+    duration_probe: subprocess.Popen | None,
+    callback_logger: CallbackLogger,
+    progress_callback: Callable[[float, str], None] | None,
+) -> tuple[int | None, str]:
+    """Run an ffmpeg command, reporting its progress while it runs.
+
+    Progress is reported as a percentage once the ffprobe in duration_probe
+    has found the input's duration. Returns the exit code, or None if ffmpeg
+    hung or ran out of time, along with whatever ffmpeg wrote to stderr.
+    """
+    # Progress comes as key=value lines on stdout; -nostats drops the status
+    # line from stderr, which then holds only messages and goes to a file
+    cmd = [cmd[0], "-nostats", "-progress", "pipe:1", *cmd[1:]]
+
+    with tempfile.TemporaryFile() as stderr_log:
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=stderr_log, text=True, bufsize=1
+        )
+
+        # A reader thread lets the wait below time out on every platform;
+        # select() can't poll pipes on Windows
+        lines: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+
+        def _read_progress():
+            for line in process.stdout:
+                lines.put(line)
+            lines.put(None)
+
+        threading.Thread(target=_read_progress, daemon=True).start()
+
+        now = time.monotonic()
+        deadline = now + MERGE_TIMEOUT
+        last_output = now
+        last_logged = now
+        last_progress = 0.0
+        return_code = None
+
+        # Scale for turning FFmpeg's microsecond output time into a percentage,
+        # worked out from the duration when the first output time arrives
+        total_duration = None
+        percent_per_us = None
+        try:
+            while True:
+                now = time.monotonic()
+                if now > deadline:
+                    callback_logger.error("Merge operation timed out")
+                    break
+                try:
+                    line = lines.get(timeout=1.0)
+                except queue.Empty:
+                    if now - last_output > MERGE_STALL_TIMEOUT:
+                        callback_logger.warning(
+                            f"FFmpeg appears to be hanging (no output for {MERGE_STALL_TIMEOUT}s)"
+                        )
+                        break
+                    continue
+
+                if line is None:
+                    return_code = process.wait()
+                    callback_logger.info(
+                        f"FFmpeg finished with return code: {return_code}"
+                    )
+                    break
+
+                last_output = time.monotonic()
+                # Of the dozen keys in each progress block, only the time is used
+                if not line.startswith("out_time_ms="):
+                    continue
+                try:
+                    # Despite the name, FFmpeg reports microseconds here
+                    time_us = int(line[12:])
+                except ValueError:
+                    continue  # N/A until the first frame is written
+                current_time = time_us / 1000000.0
+
+                if duration_probe:
+                    total_duration = _read_duration(duration_probe, callback_logger)
+                    duration_probe = None
+                    if total_duration:
+                        percent_per_us = 100.0 / (total_duration * 1000000.0)
+                    else:
+                        # Show indeterminate progress when duration is unknown
+                        progress_callback(
+                            50.0, "Processing video... (duration unknown)"
+                        )
+
+                if percent_per_us:
+                    progress_percent = time_us * percent_per_us
+                    if progress_percent > 100.0:
+                        progress_percent = 100.0
+                    # Only update if progress increased significantly (reduces UI updates)
+                    if progress_percent - last_progress >= 1.0:
+                        progress_callback(
+                            progress_percent,
+                            f"Processing: {current_time:.1f}s / {total_duration:.1f}s",
+                        )
+                        callback_logger.info(
+                            f"FFmpeg progress: {progress_percent:.1f}%"
+                        )
+                        last_progress = progress_percent
+                elif last_output - last_logged >= 1.0:
+                    callback_logger.info(f"FFmpeg progress: {current_time:.1f}s")
+                    last_logged = last_output
+        finally:
+            if process.poll() is None:
+                callback_logger.info("Terminating FFmpeg process")
+                process.terminate()
+                try:
+                    process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    callback_logger.warning("Force killing FFmpeg process")
+                    process.kill()
+                    process.wait()
+
+        stderr_output = _read_log_tail(stderr_log)
+
+    return return_code, stderr_output
+
+
+def schedule_cleanup(
+    files: list[str], log_callback: Callable[[str], None] | None = None
+) -> threading.Thread:
+    """Clean up temporary files on a background thread."""
+    # Not a daemon, so exiting right after a recording still removes them
+    thread = threading.Thread(
+        target=cleanup_temp_files, args=(files, log_callback), name="temp-cleanup"
+    )
+    thread.start()
+    return thread
+
+
 def cleanup_temp_files(
     files: list[str], log_callback: Callable[[str], None] | None = None
 ) -> int:
@@ -753,11 +1430,12 @@ def cleanup_temp_files(
 
     cleaned_count = 0
 
-    for file_path in files:
-        if safe_remove_file(file_path, logger):
+    # A path listed twice is only unlinked once; safe_remove_file already
+    # treats a missing file as removed without a separate stat, and reports
+    # each failure with its cause through the callback logger
+    for file_path in dict.fromkeys(files):
+        if safe_remove_file(file_path, callback_logger):
             cleaned_count += 1
-        else:
-            callback_logger.warning(f"Failed to remove temporary file: {file_path}")
 
     if cleaned_count > 0:
         callback_logger.info(f"Cleaned up {cleaned_count} temporary files")